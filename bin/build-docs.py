@@ -1,17 +1,35 @@
+import argparse
+import shutil
 from pathlib import Path
 from sphinx.cmd.build import main
 
 # path variables
 PROJECT_DIR = Path(__file__).parent.parent
 BUILD_DIR = PROJECT_DIR / "docs/build"
+HTML_DIR = BUILD_DIR / "html"
+DOCTREE_DIR = BUILD_DIR / ".doctrees"
+
+# command line arguments
+parser = argparse.ArgumentParser(description="Build sphinx html documentation")
+parser.add_argument("--clean", action="store_true",
+                    help="remove cached doctrees and html output before building")
+args = parser.parse_args()
+
+if args.clean:
+    # keep doxygen xml output (BUILD_DIR/xml), it is not produced by sphinx
+    shutil.rmtree(HTML_DIR, ignore_errors=True)
+    shutil.rmtree(DOCTREE_DIR, ignore_errors=True)
 
 # sphinx-build arguments
 argv = [
     "-b",
     "html",
-    "-a",
+    "-j",
+    "auto",
+    "-d",
+    str(DOCTREE_DIR),
     str(PROJECT_DIR / "docs/source"),
-    str(BUILD_DIR)
+    str(HTML_DIR)
 ]
 
 main(argv)
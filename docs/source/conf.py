@@ -1,10 +1,25 @@
 # Configuration file for the Sphinx documentation builder.
-import subprocess, os
+import subprocess, os, glob
 
 read_the_docs_build = os.environ.get('READTHEDOCS', None) == 'True'
 
-if read_the_docs_build:
-    subprocess.call('cd ../../; doxygen ./Doxyfile', shell=True)
+project_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
+
+
+def doxygen_is_stale():
+    """ check if any doxygen input is newer than the generated xml index
+    """
+    index = os.path.join(project_dir, 'docs/build/xml/index.xml')
+    if not os.path.exists(index):
+        return True
+    sources = glob.glob(os.path.join(project_dir, 'src/**/*.h'), recursive=True)
+    sources += glob.glob(os.path.join(project_dir, 'src/**/*.cpp'), recursive=True)
+    sources.append(os.path.join(project_dir, 'Doxyfile'))
+    return max(os.path.getmtime(f) for f in sources) > os.path.getmtime(index)
+
+
+if read_the_docs_build and doxygen_is_stale():
+    subprocess.run(['doxygen', './Doxyfile'], check=True, cwd=project_dir)
 
 
 # -- Project information -----------------------------------------------------
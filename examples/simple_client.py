@@ -1,6 +1,8 @@
 import c104
-import random
-import time
+import signal
+import threading
+
+stop = threading.Event()
 
 
 def main():
@@ -19,9 +21,11 @@ def main():
     # start
     client.start()
 
-    while not connection.is_connected:
-        print("Waiting for connection to {0}:{1}".format(connection.ip, connection.port))
-        time.sleep(1)
+    # wait in short slices, so that Ctrl+C ends the example without delay
+    print("Waiting for connection to {0}:{1}".format(connection.ip, connection.port))
+    while not connection.wait_open(timeout_ms=500):
+        if stop.is_set():
+            return
 
     #time.sleep(3)
 
@@ -50,6 +54,7 @@ def main():
 
 
 if __name__ == "__main__":
+    signal.signal(signal.SIGINT, lambda *_: stop.set())
     c104.set_debug_mode(c104.Debug.Client|c104.Debug.Connection)
     main()
-    time.sleep(1)
+    stop.wait(1)
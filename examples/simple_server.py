@@ -1,28 +1,36 @@
 import c104
 import random
+import signal
+import threading
 import time
 
+stop = threading.Event()
+
+# point.value is a float, compare with plain numbers instead of enum members
+STEP_LOWER = int(c104.Step.LOWER)
+STEP_HIGHER = int(c104.Step.HIGHER)
+
 
 def on_step_command(point: c104.Point, previous_state: dict, message: c104.IncomingMessage) -> c104.ResponseState:
     """ handle incoming regulating step command
     """
     print("{0} STEP COMMAND on IOA: {1}, new: {2}, prev: {3}, cot: {4}, quality: {5}".format(point.type, point.io_address, point.value, previous_state, message.cot, point.quality))
 
-    if point.value == c104.Step.LOWER:
+    if point.value == STEP_LOWER:
         # do something
         return c104.ResponseState.SUCCESS
 
-    if point.value == c104.Step.HIGHER:
+    if point.value == STEP_HIGHER:
         # do something
         return c104.ResponseState.SUCCESS
 
     return c104.ResponseState.FAILURE
 
 
-def before_transmit(point: c104.Point) -> None:
+def before_transmit(point: c104.Point, _rand=random.random) -> None:
     """ update point value before transmission
     """
-    point.value = random.random() * 100
+    point.value = _rand() * 100
     print("{0} BEFORE TRANSMIT on IOA: {1}".format(point.type, point.io_address))
 
 
@@ -43,20 +51,24 @@ def main():
     # start
     server.start()
 
-    while not server.has_active_connections:
-        print("Waiting for connection")
-        time.sleep(1)
+    # wait in short slices, so that Ctrl+C ends the example without delay
+    print("Waiting for connection")
+    while not server.wait_for_connection(timeout_ms=500):
+        if stop.is_set():
+            return
 
-    time.sleep(1)
+    if stop.wait(1):
+        return
 
-    c = 0
-    while server.has_open_connections and c<30:
-        c += 1
-        print("Keep alive until disconnected")
-        time.sleep(1)
+    print("Keep alive until disconnected")
+    deadline = time.monotonic() + 30
+    while not stop.is_set() and time.monotonic() < deadline:
+        if server.wait_for_disconnect(timeout_ms=500):
+            return
 
 
 if __name__ == "__main__":
+    signal.signal(signal.SIGINT, lambda *_: stop.set())
     c104.set_debug_mode(c104.Debug.Server)
     main()
-    time.sleep(1)
+    stop.wait(1)
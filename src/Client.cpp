@@ -259,14 +259,14 @@ void Client::onNewPoint(std::shared_ptr<Object::Station> station,
 void Client::thread_run() {
   running.store(true);
   std::unique_lock<std::mutex> lock(runThread_mutex);
-  std::chrono::system_clock::time_point desiredEnd;
+  std::chrono::steady_clock::time_point desiredEnd;
   bool debug = false;
   uint_fast8_t count = 0;
   uint_fast8_t active = 0;
 
   while (enabled.load()) {
     debug = DEBUG_TEST(Debug::Client);
-    desiredEnd = std::chrono::system_clock::now() + tickRate_ms.load() * 1ms;
+    desiredEnd = std::chrono::steady_clock::now() + tickRate_ms.load() * 1ms;
 
     count = 0;
     active = 0;
@@ -322,7 +322,7 @@ void Client::thread_run() {
     runThread_wait.wait_until(lock, desiredEnd);
     if (debug) {
       auto diff = std::chrono::duration_cast<std::chrono::microseconds>(
-                      std::chrono::system_clock::now() - desiredEnd)
+                      std::chrono::steady_clock::now() - desiredEnd)
                       .count();
       if (diff > 5000) {
         DEBUG_PRINT_CONDITION(true, Debug::Client,
@@ -141,22 +141,12 @@ void Server::start() {
 void Server::thread_run() {
   running.store(true);
   std::unique_lock<std::mutex> lock(runThread_mutex);
-  uint_fast16_t count = 0;
-  std::chrono::system_clock::time_point desiredEnd;
+  std::chrono::steady_clock::time_point desiredEnd;
   bool debug = false;
 
   while (enabled.load()) {
     debug = DEBUG_TEST(Debug::Server);
-    desiredEnd = std::chrono::system_clock::now() + tickRate_ms.load() * 1ms;
-
-    count = CS104_Slave_getOpenConnections(slave);
-    if (count != openConnections) {
-      openConnections = count;
-
-      DEBUG_PRINT_CONDITION(debug, Debug::Server,
-                            "thread_run] Connected clients: " +
-                                std::to_string(count));
-    }
+    desiredEnd = std::chrono::steady_clock::now() + tickRate_ms.load() * 1ms;
 
     // @TODO periodic transmission should be handled on per connection basis or
     // dropped
@@ -168,7 +158,7 @@ void Server::thread_run() {
 
     if (debug) {
       auto diff = std::chrono::duration_cast<std::chrono::microseconds>(
-                      std::chrono::system_clock::now() - desiredEnd)
+                      std::chrono::steady_clock::now() - desiredEnd)
                       .count();
       if (diff > 5000) {
         DEBUG_PRINT_CONDITION(true, Debug::Server,
@@ -205,9 +195,12 @@ void Server::stop() {
   for (auto &it : connectionMap) {
     IMasterConnection_close(it.first);
   }
-  connectionMap.clear();
-  activeConnections.store(0);
-  openConnections.store(0);
+  {
+    std::lock_guard<Module::GilAwareMutex> const lock(connection_mutex);
+    connectionMap.clear();
+    activeConnections.store(0);
+    setOpenConnectionCount(0);
+  }
 
   DEBUG_PRINT(Debug::Server, "stop] Stopped");
 }
@@ -231,7 +224,31 @@ bool Server::hasActiveConnections() const {
 }
 
 std::uint_fast8_t Server::getActiveConnectionCount() const {
-  return openConnections.load();
+  return activeConnections.load();
+}
+
+bool Server::waitForConnection(const std::uint_fast32_t timeout_ms) {
+  Module::ScopedGilRelease const scoped("Server.waitForConnection");
+
+  std::unique_lock<std::mutex> lock(connections_wait_mutex);
+  return connections_wait.wait_for(lock, timeout_ms * 1ms,
+                                   [this] { return hasActiveConnections(); });
+}
+
+bool Server::waitForDisconnect(const std::uint_fast32_t timeout_ms) {
+  Module::ScopedGilRelease const scoped("Server.waitForDisconnect");
+
+  std::unique_lock<std::mutex> lock(connections_wait_mutex);
+  return connections_wait.wait_for(lock, timeout_ms * 1ms,
+                                   [this] { return !hasOpenConnections(); });
+}
+
+void Server::setOpenConnectionCount(const std::uint_fast8_t count) {
+  {
+    std::lock_guard<std::mutex> const lock(connections_wait_mutex);
+    openConnections.store(count);
+  }
+  connections_wait.notify_all();
 }
 
 Object::StationVector Server::getStations() const {
@@ -287,11 +304,10 @@ void Server::onReceiveRaw(unsigned char *msg, unsigned char msgSize) {
   if (py_onReceiveRaw.is_set()) {
     DEBUG_PRINT(Debug::Server, "CALLBACK on_receive_raw");
     Module::ScopedGilAcquire const scoped("Server.on_receive_raw");
-    PyObject *pymemview =
-        PyMemoryView_FromMemory((char *)msg, msgSize, PyBUF_READ);
-    PyObject *pybytes = PyBytes_FromObject(pymemview);
+    // single copy of the message buffer, reference is owned by pybytes
+    py::bytes const pybytes(reinterpret_cast<const char *>(msg), msgSize);
 
-    py_onReceiveRaw.call(shared_from_this(), py::handle(pybytes));
+    py_onReceiveRaw.call(shared_from_this(), pybytes);
   }
 }
 
@@ -303,11 +319,10 @@ void Server::onSendRaw(unsigned char *msg, unsigned char msgSize) {
   if (py_onSendRaw.is_set()) {
     DEBUG_PRINT(Debug::Server, "CALLBACK on_send_raw");
     Module::ScopedGilAcquire const scoped("Server.on_send_raw");
-    PyObject *pymemview =
-        PyMemoryView_FromMemory((char *)msg, msgSize, PyBUF_READ);
-    PyObject *pybytes = PyBytes_FromObject(pymemview);
+    // single copy of the message buffer, reference is owned by pybytes
+    py::bytes const pybytes(reinterpret_cast<const char *>(msg), msgSize);
 
-    py_onSendRaw.call(shared_from_this(), py::handle(pybytes));
+    py_onSendRaw.call(shared_from_this(), pybytes);
   }
 }
 
@@ -434,6 +449,8 @@ void Server::connectionEventHandler(void *parameter,
   char ipAddrStr[60];
   IMasterConnection_getPeerAddress(connection, ipAddrStr, 60);
 
+  std::uint_fast8_t previous = 0;
+  std::uint_fast8_t count = 0;
   {
     std::lock_guard<Module::GilAwareMutex> const lock(
         instance->connection_mutex);
@@ -481,8 +498,16 @@ void Server::connectionEventHandler(void *parameter,
         it->second = false;
       }
     }
+    // update while locked to keep open and active count consistent
+    previous = instance->openConnections.load();
+    count = instance->connectionMap.size();
+    instance->setOpenConnectionCount(count);
   }
 
+  DEBUG_PRINT_CONDITION(debug && previous != count, Debug::Server,
+                        "connection_event_handler] Connected clients: " +
+                            std::to_string(count));
+
   if (debug) {
     end = std::chrono::steady_clock::now();
     DEBUG_PRINT_CONDITION(
@@ -1205,8 +1230,7 @@ bool Server::asduHandler(void *parameter, IMasterConnection connection,
               // only in case of auto return
               if ((responseState == RESPONSE_STATE_SUCCESS) &&
                   point->getRelatedInformationObjectAutoReturn()) {
-                related_point = station->getPoint(
-                    point->getRelatedInformationObjectAddress());
+                related_point = point->getRelatedPoint();
               }
 
             } else {
@@ -136,6 +136,22 @@ public:
    */
   std::uint_fast8_t getActiveConnectionCount() const;
 
+  /**
+   * @brief Block until the Server has at least one active (open and not muted)
+   * connection to a client or the timeout expires
+   * @param timeout_ms maximum time to wait in milliseconds
+   * @return information if at least one connection is active
+   */
+  bool waitForConnection(std::uint_fast32_t timeout_ms);
+
+  /**
+   * @brief Block until the Server has no open connections to clients or the
+   * timeout expires
+   * @param timeout_ms maximum time to wait in milliseconds
+   * @return information if no connection is open
+   */
+  bool waitForDisconnect(std::uint_fast32_t timeout_ms);
+
   /**
    * @brief Get a list of all Stations
    * @return vector with object stationer
@@ -295,6 +311,12 @@ private:
   /// @brief number of open connections
   std::atomic_uint_fast8_t openConnections{0};
 
+  /// @brief MUTEX Lock to wait for connection changes
+  std::mutex connections_wait_mutex{};
+
+  /// @brief Condition to wait for connection changes
+  std::condition_variable connections_wait{};
+
   /// @brief maximum number of connections (0-255), 0 = no limit
   std::atomic_uint_fast8_t maxOpenConnections{0};
 
@@ -342,6 +364,13 @@ private:
   // void thread_callback();
 
 public:
+  /**
+   * @brief Update open connection count and wake up threads waiting for
+   * connection changes
+   * @param count number of open connections
+   */
+  void setOpenConnectionCount(std::uint_fast8_t count);
+
   /**
    * @brief Callback to accept or decline incoming client connections
    * @param parameter reference to custom bound connection data
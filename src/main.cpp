@@ -86,6 +86,8 @@ PYBIND11_MODULE(c104, m) {
   options.disable_function_signatures();
   options.disable_enum_members_docstring();
 
+  Object::DataPoint::initPreviousStateKeys(m);
+
   py::enum_<InformationType>(
       m, "Data",
       "This enum contains all available information types for a datapoint")
@@ -1118,6 +1120,47 @@ PYBIND11_MODULE(c104, m) {
                              "int: get number of active (open and not muted) "
                              "connections to clients (read-only)",
                              py::return_value_policy::copy)
+      .def("wait_for_connection", &Server::waitForConnection, R"def(
+    wait_for_connection(self: c104.Server, timeout_ms: int = 10000) -> bool
+
+    block until at least one client connection is active (open and not muted) or the timeout expires
+
+    Parameters
+    ----------
+    timeout_ms: int
+        maximum time to wait in milliseconds
+
+    Returns
+    -------
+    bool
+        True if at least one connection is active, else False
+
+    Example
+    -------
+    >>> if not my_server.wait_for_connection(timeout_ms=10000):
+    >>>     print("no client connected")
+)def",
+           "timeout_ms"_a = 10000, py::return_value_policy::copy)
+      .def("wait_for_disconnect", &Server::waitForDisconnect, R"def(
+    wait_for_disconnect(self: c104.Server, timeout_ms: int = 10000) -> bool
+
+    block until all client connections are closed or the timeout expires
+
+    Parameters
+    ----------
+    timeout_ms: int
+        maximum time to wait in milliseconds
+
+    Returns
+    -------
+    bool
+        True if no connection is open, else False
+
+    Example
+    -------
+    >>> my_server.wait_for_disconnect(timeout_ms=30000)
+)def",
+           "timeout_ms"_a = 10000, py::return_value_policy::copy)
       .def_property_readonly(
           "has_stations", &Server::hasStations,
           "bool: test if local server has at least one station (read-only)",
@@ -1386,6 +1429,27 @@ PYBIND11_MODULE(c104, m) {
       .def_property_readonly("is_muted", &Remote::Connection::isMuted,
                              "bool: test if connection is muted (read-only)",
                              py::return_value_policy::copy)
+      .def("wait_open", &Remote::Connection::waitOpen, R"def(
+    wait_open(self: c104.Connection, timeout_ms: int = 10000) -> bool
+
+    block until the connection to the remote terminal unit (server) is opened or the timeout expires
+
+    Parameters
+    ----------
+    timeout_ms: int
+        maximum time to wait in milliseconds
+
+    Returns
+    -------
+    bool
+        True if the connection is open, else False
+
+    Example
+    -------
+    >>> if not my_connection.wait_open(timeout_ms=10000):
+    >>>     print("connection timeout")
+)def",
+           "timeout_ms"_a = 10000, py::return_value_policy::copy)
       .def_property(
           "originator_address", &Remote::Connection::getOriginatorAddress,
           &Remote::Connection::setOriginatorAddress,
@@ -1724,6 +1788,34 @@ PYBIND11_MODULE(c104, m) {
           "points", &Object::Station::getPoints,
           "List[:ref:`c104.Point`] list of all Point objects (read-only)",
           py::return_value_policy::copy)
+      .def(
+          "points_snapshot",
+          [](Object::Station &s) {
+            auto const states = s.getPointStates();
+            py::list rows(states.size());
+            std::size_t i = 0;
+            for (auto &state : states) {
+              rows[i++] = py::make_tuple(
+                  state.type, state.informationObjectAddress, state.value,
+                  state.updatedAt_ms, state.reportedAt_ms, state.quality);
+            }
+            return rows;
+          },
+          R"def(
+    points_snapshot(self: c104.Station) -> List[Tuple[c104.Type, int, float, int, int, c104.Quality]]
+
+    get the current state of all points of this station with a single call
+
+    Returns
+    -------
+    List[Tuple[:ref:`c104.Type`, int, float, int, int, :ref:`c104.Quality`]]
+        one tuple (type, io_address, value, updated_at_ms, reported_at_ms, quality) per point
+
+    Example
+    -------
+    >>> for pt_type, io_address, value, updated_at_ms, reported_at_ms, quality in my_station.points_snapshot():
+    >>>     print("{0} {1}: {2}".format(pt_type, io_address, value))
+)def")
       .def("get_point", &Object::Station::getPoint, R"def(
     get_point(self: c104.Station, io_address: int) -> Optional[c104.Point]
 
@@ -1783,7 +1875,111 @@ PYBIND11_MODULE(c104, m) {
     >>> station_1 = my_server.add_station(common_address=15)
 )def",
            "io_address"_a, "type"_a, "report_ms"_a = 0,
-           "related_io_address"_a = 0, "related_io_autoreturn"_a = false);
+           "related_io_address"_a = 0, "related_io_autoreturn"_a = false)
+      .def(
+          "add_points",
+          [](Object::Station &s, const py::list &points,
+             py::object on_before_auto_transmit, py::object on_before_read) {
+            std::vector<Object::DataPointDefinition> definitions{};
+            definitions.reserve(points.size());
+            for (auto item : points) {
+              auto d = py::cast<py::dict>(item);
+              if (!d.contains("io_address") || !d.contains("type")) {
+                throw std::invalid_argument(
+                    "Point definition requires io_address and type");
+              }
+              Object::DataPointDefinition definition{};
+              definition.informationObjectAddress =
+                  py::cast<std::uint_fast32_t>(d["io_address"]);
+              definition.type = py::cast<IEC60870_5_TypeID>(d["type"]);
+              if (d.contains("report_ms")) {
+                definition.reportInterval_ms =
+                    py::cast<std::uint_fast32_t>(d["report_ms"]);
+              }
+              if (d.contains("related_io_address")) {
+                definition.relatedInformationObjectAddress =
+                    py::cast<std::uint_fast32_t>(d["related_io_address"]);
+              }
+              if (d.contains("related_io_autoreturn")) {
+                definition.relatedInformationObjectAutoReturn =
+                    py::cast<bool>(d["related_io_autoreturn"]);
+              }
+              definitions.push_back(definition);
+            }
+
+            // callbacks are set before the points are added to the station
+            return s.addPoints(
+                definitions,
+                [&on_before_auto_transmit, &on_before_read](
+                    const std::shared_ptr<Object::DataPoint> &point) {
+                  if (!on_before_auto_transmit.is_none()) {
+                    point->setOnBeforeAutoTransmitCallback(
+                        on_before_auto_transmit);
+                  }
+                  if (!on_before_read.is_none()) {
+                    point->setOnBeforeReadCallback(on_before_read);
+                  }
+                });
+          },
+          R"def(
+    add_points(self: c104.Station, points: List[dict], on_before_auto_transmit: Optional[Callable[[c104.Point], None]] = None, on_before_read: Optional[Callable[[c104.Point], None]] = None) -> List[Optional[c104.Point]]
+
+    add multiple new points to this station at once and return the new point objects
+
+    Parameters
+    ----------
+    points: List[dict]
+        point definitions, each with the keys io_address and type and the optional keys report_ms, related_io_address and related_io_autoreturn, see add_point
+    on_before_auto_transmit: Optional[Callable[[c104.Point], None]]
+        python callback that will be set as on_before_auto_transmit callback of every new point (server-sided only)
+    on_before_read: Optional[Callable[[c104.Point], None]]
+        python callback that will be set as on_before_read callback of every new point (server-sided only)
+
+    Returns
+    -------
+    List[Optional[:ref:`c104.Point`]]
+        new point objects in order of definitions, None for every information object address that already exists
+
+    Raises
+    ------
+    ValueError
+        If a definition misses io_address or type or contains invalid values, no point is added in this case
+    ValueError
+        If a callback is set, but callable signature does not match exactly or function is called from client context, no point is added in this case
+
+    Example
+    -------
+    >>> points = station_1.add_points(points=[{"io_address": 21, "type": c104.Type.M_ME_NC_1, "report_ms": 15000}, {"io_address": 22, "type": c104.Type.M_ME_NC_1, "report_ms": 15000}], on_before_read=on_before_read_steppoint)
+)def",
+          "points"_a, "on_before_auto_transmit"_a = py::none(),
+          "on_before_read"_a = py::none(), py::return_value_policy::copy)
+      .def("transmit_many", &Object::Station::transmitPoints, R"def(
+    transmit_many(self: c104.Station, points: List[Tuple[c104.Point, c104.Cot]]) -> List[bool]
+
+    transmit multiple points of this station in order, see point method transmit
+
+    Parameters
+    ----------
+    points: List[Tuple[:ref:`c104.Point`, :ref:`c104.Cot`]]
+        points to transmit, each with its cause of transmission
+
+    Returns
+    -------
+    List[bool]
+        transmit result of every point in order
+
+    Raises
+    ------
+    ValueError
+        If a point does not belong to this station, no point is transmitted in this case
+    ValueError
+        If parent station, server or connection reference is invalid
+
+    Example
+    -------
+    >>> results = station_1.transmit_many(points=[(point_1, c104.Cot.SPONTANEOUS), (point_2, c104.Cot.SPONTANEOUS)])
+)def",
+           "points"_a, py::return_value_policy::copy);
 
   py::class_<Object::DataPoint, std::shared_ptr<Object::DataPoint>>(
       m, "Point",
@@ -1808,6 +2004,10 @@ PYBIND11_MODULE(c104, m) {
                     &Object::DataPoint::setRelatedInformationObjectAddress,
                     "int: io_address of a related monitoring point",
                     py::return_value_policy::copy)
+      .def_property_readonly(
+          "related_point", &Object::DataPoint::getRelatedPoint,
+          "Optional[:ref:`c104.Point`]: related monitoring point identified "
+          "by related_io_address (read-only)")
       .def_property(
           "related_io_autoreturn",
           &Object::DataPoint::getRelatedInformationObjectAutoReturn,
@@ -1822,6 +2022,11 @@ PYBIND11_MODULE(c104, m) {
       .def_property(
           "value", &Object::DataPoint::getValue,
           [](Object::DataPoint &d1, const py::object &o) {
+            // most values are plain floats, skip enum type lookups for them
+            if (PyFloat_Check(o.ptr())) {
+              d1.setValue(PyFloat_AS_DOUBLE(o.ptr()));
+              return;
+            }
             if (py::isinstance<StepCommandValue>(o)) {
               d1.setValue(static_cast<int>(py::cast<StepCommandValue>(o)));
               return;
@@ -1901,6 +2106,36 @@ PYBIND11_MODULE(c104, m) {
     >>> sv_command_point.on_receive(callable=on_setpoint_command)
 )def",
            "callable"_a)
+      .def_property_readonly(
+          "received_count", &Object::DataPoint::getReceivedCount,
+          "int: number of messages received for this point (read-only)",
+          py::return_value_policy::copy)
+      .def("wait_for_update", &Object::DataPoint::waitForUpdate, R"def(
+    wait_for_update(self: c104.Point, timeout_ms: int = 10000, received_count: int = -1) -> bool
+
+    block until a new message for this point is received or the timeout expires
+
+    Parameters
+    ----------
+    timeout_ms: int
+        maximum time to wait in milliseconds
+    received_count: int
+        wait until more messages than this received_count are received, -1 = received_count at call time
+
+    Returns
+    -------
+    bool
+        True if a message was received, else False
+
+    Example
+    -------
+    >>> count = cl_measurement_point.received_count
+    >>> cl_setpoint.transmit(cause=c104.Cot.ACTIVATION)
+    >>> if not cl_measurement_point.wait_for_update(timeout_ms=3000, received_count=count):
+    >>>     print("no update received")
+)def",
+           "timeout_ms"_a = 10000, "received_count"_a = -1,
+           py::return_value_policy::copy)
       .def("on_before_read", &Object::DataPoint::setOnBeforeReadCallback, R"def(
     on_before_read(self: c104.Point, callable: Callable[[c104.Point], None]) -> None
 
@@ -1992,7 +2227,7 @@ PYBIND11_MODULE(c104, m) {
 )def",
            py::return_value_policy::copy)
       .def("set", &Object::DataPoint::setValueEx, R"def(
-    set(self: c104.Point, value: float, quality: c104.Quality, timestamp_ms: int) -> None
+    set(self: c104.Point, value: float, quality: c104.Quality, timestamp_ms: int = 0) -> None
 
     set value, quality and timestamp
 
@@ -2003,7 +2238,7 @@ PYBIND11_MODULE(c104, m) {
     quality: :ref:`c104.Quality`
         quality restrictions if any
     timestamp_ms: int
-        modification timestamp in milliseconds
+        modification timestamp in milliseconds, 0 = current time
 
     Returns
     -------
@@ -2011,9 +2246,10 @@ PYBIND11_MODULE(c104, m) {
 
     Example
     -------
-    >>> sv_measurement_point.set(value=-1234.56, quality=c104.Quality.Invalid, timestamp_ms=int(time.time() * 1000))
+    >>> sv_measurement_point.set(value=-1234.56, quality=c104.Quality.Invalid)
+    >>> sv_measurement_point.set(value=-1234.56, quality=c104.Quality.Invalid, timestamp_ms=1680517666000)
 )def",
-           "value"_a, "quality"_a, "timestamp_ms"_a)
+           "value"_a, "quality"_a, "timestamp_ms"_a = 0)
       .def("transmit", &Object::DataPoint::transmit, R"def(
     transmit(self: c104.Point, cause: c104.Cot = c104.Cot.UNKNOWN_COT) -> bool
 
@@ -2044,9 +2280,10 @@ PYBIND11_MODULE(c104, m) {
 
     Example
     -------
-    >>> sv_measurement_point.transmit(cause=c104.Cot.SPONTANEOUS)
+    >>> sv_measurement_point.transmit(c104.Cot.SPONTANEOUS)
 )def",
-           "cause"_a = CS101_COT_UNKNOWN_COT, py::return_value_policy::copy);
+           py::arg("cause").noconvert() = CS101_COT_UNKNOWN_COT,
+           py::return_value_policy::copy);
 
   py::class_<Remote::Message::IncomingMessage,
              std::shared_ptr<Remote::Message::IncomingMessage>>(
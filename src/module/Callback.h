@@ -116,8 +116,6 @@ protected:
 
   std::atomic_bool success{false};
 
-  std::chrono::steady_clock::time_point begin, end;
-
   mutable Module::GilAwareMutex callback_mutex{"Callback::callback_mutex"};
 };
 
@@ -135,8 +133,11 @@ public:
       return false;
     }
 
-    if (DEBUG_TEST(Debug::Callback)) {
-      this->begin = std::chrono::steady_clock::now();
+    // test debug mode once, timestamps are local to support concurrent calls
+    bool const debug = DEBUG_TEST(Debug::Callback);
+    std::chrono::steady_clock::time_point begin;
+    if (debug) {
+      begin = std::chrono::steady_clock::now();
     }
 
     try {
@@ -162,14 +163,14 @@ public:
       this->unset();
     }
 
-    if (DEBUG_TEST(Debug::Callback)) {
-      this->end = std::chrono::steady_clock::now();
+    if (debug) {
+      auto const end = std::chrono::steady_clock::now();
       DEBUG_PRINT_CONDITION(
           true, Debug::Callback,
           name + "] Stats | TOTAL " +
               std::to_string(
                   std::chrono::duration_cast<std::chrono::microseconds>(
-                      this->end - this->begin)
+                      end - begin)
                       .count()) +
               u8" \xb5s");
     }
@@ -210,8 +211,11 @@ public:
       return false;
     }
 
-    if (DEBUG_TEST(Debug::Callback)) {
-      this->begin = std::chrono::steady_clock::now();
+    // test debug mode once, timestamps are local to support concurrent calls
+    bool const debug = DEBUG_TEST(Debug::Callback);
+    std::chrono::steady_clock::time_point begin;
+    if (debug) {
+      begin = std::chrono::steady_clock::now();
     }
 
     try {
@@ -236,14 +240,14 @@ public:
       this->unset();
     }
 
-    if (DEBUG_TEST(Debug::Callback)) {
-      this->end = std::chrono::steady_clock::now();
+    if (debug) {
+      auto const end = std::chrono::steady_clock::now();
       DEBUG_PRINT_CONDITION(
           true, Debug::Callback,
           name + "] Stats | TOTAL " +
               std::to_string(
                   std::chrono::duration_cast<std::chrono::microseconds>(
-                      this->end - this->begin)
+                      end - begin)
                       .count()) +
               u8" \xb5s");
     }
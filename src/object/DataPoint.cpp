@@ -31,6 +31,7 @@
 
 #include "object/DataPoint.h"
 #include "module/ScopedGilAcquire.h"
+#include "module/ScopedGilRelease.h"
 #include "object/Station.h"
 #include "remote/Connection.h"
 #include "remote/message/IncomingMessage.h"
@@ -39,6 +40,13 @@
 
 using namespace Object;
 
+namespace {
+// borrowed from the python module, see DataPoint::initPreviousStateKeys
+py::handle key_value;
+py::handle key_quality;
+py::handle key_updatedAt;
+} // namespace
+
 DataPoint::DataPoint(const std::uint_fast32_t dp_ioa,
                      const IEC60870_5_TypeID dp_type,
                      std::shared_ptr<Station> dp_station,
@@ -96,6 +104,17 @@ DataPoint::DataPoint(const std::uint_fast32_t dp_ioa,
 
 DataPoint::~DataPoint() { DEBUG_PRINT(Debug::Point, "Removed"); }
 
+void DataPoint::initPreviousStateKeys(py::module_ &m) {
+  // the module attribute owns the keys, callbacks only run while it is loaded
+  py::str const value("value");
+  py::str const quality("quality");
+  py::str const updatedAt("updatedAt_ms");
+  m.attr("_previous_state_keys") = py::make_tuple(value, quality, updatedAt);
+  key_value = value;
+  key_quality = quality;
+  key_updatedAt = updatedAt;
+}
+
 std::shared_ptr<Station> DataPoint::getStation() {
   if (station.expired()) {
     return {nullptr};
@@ -129,6 +148,33 @@ void DataPoint::setRelatedInformationObjectAddress(
   relatedInformationObjectAddress.store(related_io_address);
 }
 
+std::shared_ptr<DataPoint> DataPoint::getRelatedPoint() {
+  std::uint_fast32_t const related_ioa = relatedInformationObjectAddress.load();
+  if (0 == related_ioa) {
+    return {nullptr};
+  }
+
+  {
+    std::lock_guard<std::mutex> const lock(relatedPoint_mutex);
+    if (auto cached = relatedPoint.lock()) {
+      if (cached->getInformationObjectAddress() == related_ioa) {
+        return cached;
+      }
+    }
+  }
+
+  auto _station = getStation();
+  if (!_station) {
+    return {nullptr};
+  }
+  auto related = _station->getPoint(related_ioa);
+  if (related) {
+    std::lock_guard<std::mutex> const lock(relatedPoint_mutex);
+    relatedPoint = related;
+  }
+  return related;
+}
+
 bool DataPoint::getRelatedInformationObjectAutoReturn() const {
   return relatedInformationObjectAutoReturn.load();
 }
@@ -366,6 +412,11 @@ ResponseState DataPoint::onReceive(
   setValueEx(message->getValue(), message->getQuality(),
              message->getUpdatedAt());
   receivedAt_ms = GetTimestamp_ms();
+  {
+    std::lock_guard<std::mutex> const lock(receive_mutex);
+    receivedCount++;
+  }
+  receive_wait.notify_all();
 
   if (py_onReceive.is_set()) {
     DEBUG_PRINT(Debug::Point, "CALLBACK on_receive at IOA " +
@@ -373,9 +424,9 @@ ResponseState DataPoint::onReceive(
     Module::ScopedGilAcquire const scoped("Point.on_receive");
 
     py::dict prev;
-    prev["value"] = prev_value;
-    prev["quality"] = prev_quality;
-    prev["updatedAt_ms"] = prev_updatedAt;
+    prev[key_value] = prev_value;
+    prev[key_quality] = prev_quality;
+    prev[key_updatedAt] = prev_updatedAt;
 
     if (py_onReceive.call(shared_from_this(), prev, message)) {
       try {
@@ -391,6 +442,25 @@ ResponseState DataPoint::onReceive(
   return RESPONSE_STATE_SUCCESS;
 }
 
+std::uint_fast64_t DataPoint::getReceivedCount() {
+  std::lock_guard<std::mutex> const lock(receive_mutex);
+  return receivedCount;
+}
+
+bool DataPoint::waitForUpdate(const std::uint_fast32_t timeout_ms,
+                              const std::int_fast64_t since) {
+  Module::ScopedGilRelease const scoped("Point.waitForUpdate");
+
+  std::unique_lock<std::mutex> lock(receive_mutex);
+  // a count taken before sending a command also catches a response that
+  // arrives before this call
+  std::uint_fast64_t const count =
+      since < 0 ? receivedCount : static_cast<std::uint_fast64_t>(since);
+  return receive_wait.wait_for(lock, timeout_ms * 1ms, [this, count] {
+    return receivedCount != count;
+  });
+}
+
 void DataPoint::setOnBeforeReadCallback(py::object &callable) {
   auto _station = getStation();
   if (!_station) {
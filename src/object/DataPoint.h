@@ -70,6 +70,13 @@ public:
    */
   ~DataPoint();
 
+  /**
+   * @brief create the previous_state keys of on_receive callbacks once, owned
+   * by the python module
+   * @param m python module that keeps the keys alive
+   */
+  static void initPreviousStateKeys(py::module_ &m);
+
 private:
   /**
    * @brief create a new DataPoint instance
@@ -94,6 +101,12 @@ private:
   /// @brief IEC60870-5 remote address of a related measurement DataPoint
   std::atomic_uint_fast32_t relatedInformationObjectAddress{0};
 
+  /// @brief cached related measurement DataPoint (not owning pointer)
+  std::weak_ptr<DataPoint> relatedPoint{};
+
+  /// @brief MUTEX Lock to access relatedPoint
+  std::mutex relatedPoint_mutex{};
+
   /// @brief configure if related point should be auto transmitted if this point
   /// is a command point that was updated via client
   std::atomic_bool relatedInformationObjectAutoReturn{false};
@@ -117,6 +130,15 @@ private:
   /// @brief timestamp (in milliseconds) of last receiving
   std::atomic_uint_fast64_t receivedAt_ms{0};
 
+  /// @brief number of received messages, guarded by receive_mutex
+  std::uint_fast64_t receivedCount{0};
+
+  /// @brief MUTEX Lock to wait for received messages
+  std::mutex receive_mutex{};
+
+  /// @brief condition to notify waiting threads about received messages
+  std::condition_variable receive_wait{};
+
   /// @brief timestamp (in milliseconds) of last transmission
   std::atomic_uint_fast64_t sentAt_ms{0};
 
@@ -166,6 +188,13 @@ public:
   void
   setRelatedInformationObjectAddress(std::uint_fast32_t related_io_address);
 
+  /**
+   * @brief Get the related monitoring point, the result is cached until the
+   * related information object address changes
+   * @return Pointer to related DataPoint or nullptr
+   */
+  std::shared_ptr<DataPoint> getRelatedPoint();
+
   /**
    * @brief Test if a related monitoring point should be auto-transmitted on
    * incoming update of this control point
@@ -239,9 +268,10 @@ public:
   /**
    * @brief Set point value with quality restriction bitset and updated at
    * timestamp
+   * @param timestamp_ms updated at timestamp, 0 = current time
    */
   void setValueEx(double new_value, const Quality &new_quality,
-                  std::uint_fast64_t timestamp_ms);
+                  std::uint_fast64_t timestamp_ms = 0);
 
   std::uint64_t getUpdatedAt_ms() const;
 
@@ -256,6 +286,23 @@ public:
   ResponseState
   onReceive(std::shared_ptr<Remote::Message::IncomingMessage> message);
 
+  /**
+   * @brief Get the number of messages received for this point
+   * @return received message count
+   */
+  std::uint_fast64_t getReceivedCount();
+
+  /**
+   * @brief Block until a new message for this point is received or the
+   * timeout expires
+   * @param timeout_ms maximum time to wait in milliseconds
+   * @param since received message count to wait beyond, a negative value
+   * waits beyond the count at call time
+   * @return true if a message was received, false if the timeout expired
+   */
+  bool waitForUpdate(std::uint_fast32_t timeout_ms,
+                     std::int_fast64_t since = -1);
+
   /**
    * @brief set python callback that will be executed on every incoming message
    * @throws std::invalid_argument if callable signature does not match
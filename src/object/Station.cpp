@@ -31,8 +31,11 @@
 
 #include "object/Station.h"
 #include "Server.h"
+#include "module/ScopedGilRelease.h"
 #include "remote/Connection.h"
 
+#include <unordered_set>
+
 using namespace Object;
 
 Station::Station(std::uint_fast16_t st_commonAddress,
@@ -46,6 +49,7 @@ Station::Station(std::uint_fast16_t st_commonAddress,
 Station::~Station() {
   {
     std::scoped_lock<Module::GilAwareMutex> const lock(points_mutex);
+    pointIoaMap.clear();
     points.clear();
   }
   DEBUG_PRINT(Debug::Station, "Removed");
@@ -79,6 +83,19 @@ DataPointVector Station::getPoints() const {
   return points;
 }
 
+std::vector<DataPointState> Station::getPointStates() const {
+  std::scoped_lock<Module::GilAwareMutex> const lock(points_mutex);
+
+  std::vector<DataPointState> states{};
+  states.reserve(points.size());
+  for (auto &p : points) {
+    states.push_back({p->getType(), p->getInformationObjectAddress(),
+                      p->getValue(), p->getUpdatedAt_ms(),
+                      p->getReportedAt_ms(), p->getQuality()});
+  }
+  return states;
+}
+
 std::shared_ptr<DataPoint>
 Station::getPoint(const std::uint_fast32_t informationObjectAddress) {
   if (0 == informationObjectAddress) {
@@ -86,10 +103,9 @@ Station::getPoint(const std::uint_fast32_t informationObjectAddress) {
   }
 
   std::scoped_lock<Module::GilAwareMutex> const lock(points_mutex);
-  for (auto &p : points) {
-    if (p->getInformationObjectAddress() == informationObjectAddress) {
-      return p;
-    }
+  auto const it = pointIoaMap.find(informationObjectAddress);
+  if (it != pointIoaMap.end()) {
+    return it->second;
   }
   return {nullptr};
 }
@@ -100,7 +116,8 @@ Station::addPoint(const std::uint_fast32_t informationObjectAddress,
                   const std::uint_fast32_t reportInterval_ms,
                   const std::uint_fast32_t relatedInformationObjectAddress,
                   const bool relatedInformationObjectAutoReturn) {
-  if (getPoint(informationObjectAddress)) {
+  std::scoped_lock<Module::GilAwareMutex> const lock(points_mutex);
+  if (pointIoaMap.count(informationObjectAddress)) {
     return {nullptr};
   }
 
@@ -108,7 +125,6 @@ Station::addPoint(const std::uint_fast32_t informationObjectAddress,
               "add_point] " + std::string(TypeID_toString(type)) + " | IOA " +
                   std::to_string(informationObjectAddress));
 
-  std::scoped_lock<Module::GilAwareMutex> const lock(points_mutex);
   auto point = DataPoint::create(
       informationObjectAddress, type, shared_from_this(), reportInterval_ms,
       relatedInformationObjectAddress, relatedInformationObjectAutoReturn);
@@ -117,7 +133,77 @@ Station::addPoint(const std::uint_fast32_t informationObjectAddress,
   // relatedInformationObjectAutoReturn);
 
   points.push_back(point);
+  pointIoaMap[informationObjectAddress] = point;
   return point;
 }
 
+DataPointVector
+Station::addPoints(
+    const std::vector<DataPointDefinition> &definitions,
+    const std::function<void(const std::shared_ptr<DataPoint> &)> &configure) {
+  DEBUG_PRINT(Debug::Station,
+              "add_points] Count " + std::to_string(definitions.size()));
+
+  std::scoped_lock<Module::GilAwareMutex> const lock(points_mutex);
+
+  // skip existing information object addresses and duplicates within
+  // definitions before any point is created or configured
+  DataPointVector created(definitions.size(), nullptr);
+  std::unordered_set<std::uint_fast32_t> ioas{};
+  ioas.reserve(definitions.size());
+  for (std::size_t i = 0; i < definitions.size(); i++) {
+    auto &d = definitions[i];
+    if (pointIoaMap.count(d.informationObjectAddress) ||
+        !ioas.insert(d.informationObjectAddress).second) {
+      continue;
+    }
+    created[i] = DataPoint::create(
+        d.informationObjectAddress, d.type, shared_from_this(),
+        d.reportInterval_ms, d.relatedInformationObjectAddress,
+        d.relatedInformationObjectAutoReturn);
+  }
+
+  // configure all new points before adding any, so that an invalid definition
+  // or a failing configuration leaves the station unchanged
+  if (configure) {
+    for (auto &point : created) {
+      if (point) {
+        configure(point);
+      }
+    }
+  }
+
+  points.reserve(points.size() + ioas.size());
+  pointIoaMap.reserve(pointIoaMap.size() + ioas.size());
+  for (auto &point : created) {
+    if (point) {
+      points.push_back(point);
+      pointIoaMap[point->getInformationObjectAddress()] = point;
+    }
+  }
+  return created;
+}
+
+std::vector<bool> Station::transmitPoints(
+    const std::vector<std::pair<std::shared_ptr<DataPoint>,
+                                CS101_CauseOfTransmission>> &transmissions) {
+  DEBUG_PRINT(Debug::Station,
+              "transmit_points] Count " + std::to_string(transmissions.size()));
+
+  for (auto &t : transmissions) {
+    if (!t.first || t.first->getStation().get() != this) {
+      throw std::invalid_argument("Point does not belong to this station");
+    }
+  }
+
+  Module::ScopedGilRelease const scoped("Station.transmitPoints");
+
+  std::vector<bool> results{};
+  results.reserve(transmissions.size());
+  for (auto &t : transmissions) {
+    results.push_back(t.first->transmit(t.second));
+  }
+  return results;
+}
+
 bool Station::isLocal() { return !server.expired(); }
@@ -38,6 +38,31 @@
 
 namespace Object {
 
+/**
+ * @brief definition of a single DataPoint for batch creation via
+ * Station::addPoints
+ */
+struct DataPointDefinition {
+  std::uint_fast32_t informationObjectAddress{0};
+  IEC60870_5_TypeID type{M_EI_NA_1};
+  std::uint_fast32_t reportInterval_ms{0};
+  std::uint_fast32_t relatedInformationObjectAddress{0};
+  bool relatedInformationObjectAutoReturn{false};
+};
+
+/**
+ * @brief current state of a single DataPoint as read via
+ * Station::getPointStates
+ */
+struct DataPointState {
+  IEC60870_5_TypeID type{M_EI_NA_1};
+  std::uint_fast32_t informationObjectAddress{0};
+  double value{0};
+  std::uint_fast64_t updatedAt_ms{0};
+  std::uint_fast64_t reportedAt_ms{0};
+  Quality quality{Quality::None};
+};
+
 class Station : public std::enable_shared_from_this<Station> {
 public:
   // noncopyable
@@ -80,8 +105,8 @@ private:
   /// @brief mutex to lock member read/write access
   mutable Module::GilAwareMutex points_mutex{"Station::points_mutex"};
 
-  /// @brief conversion hashmap {IOA,not owning pointer to child DataPoints} to
-  /// find a DataPoint via IOA
+  /// @brief conversion hashmap {IOA,pointer to child DataPoints} to find a
+  /// DataPoint via IOA, access is guarded by points_mutex
   std::unordered_map<std::uint_fast32_t, std::shared_ptr<DataPoint>>
       pointIoaMap{};
 
@@ -104,6 +129,12 @@ public:
    */
   DataPointVector getPoints() const;
 
+  /**
+   * @brief Get the current state of all DataPoints
+   * @return vector with one state per DataPoint in order of insertion
+   */
+  std::vector<DataPointState> getPointStates() const;
+
   /**
    * @brief Get a DataPoint that exists at this NetworkStation and is identified
    * via information object address
@@ -128,6 +159,37 @@ public:
            std::uint_fast32_t relatedInformationObjectAddress = 0,
            bool relatedInformationObjectAutoReturn = false);
 
+  /**
+   * @brief Add multiple DataPoints to this Station at once
+   * @param definitions list of point definitions
+   * @param configure optional function that is called for every new DataPoint
+   * before any of them is added, e.g. to set callbacks, it is not called for
+   * information object addresses that already exist
+   * @return vector with new DataPoints, containing nullptr for every
+   * information object address that already exists
+   * @throws std::invalid_argument if any definition is invalid, no DataPoint
+   * is added in this case
+   * @throws std::exception any exception thrown by configure, no DataPoint is
+   * added in this case
+   */
+  DataPointVector
+  addPoints(const std::vector<DataPointDefinition> &definitions,
+            const std::function<void(const std::shared_ptr<DataPoint> &)>
+                &configure = nullptr);
+
+  /**
+   * @brief Transmit multiple DataPoints of this Station without re-acquiring
+   * the GIL in between
+   * @param transmissions list of DataPoints and the cause of transmission for
+   * each of them
+   * @return vector with the transmit result of every DataPoint in order
+   * @throws std::invalid_argument if a DataPoint does not belong to this
+   * Station, no DataPoint is transmitted in this case
+   */
+  std::vector<bool> transmitPoints(
+      const std::vector<std::pair<std::shared_ptr<DataPoint>,
+                                  CS101_CauseOfTransmission>> &transmissions);
+
   bool isLocal();
 
 public:
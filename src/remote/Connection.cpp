@@ -110,7 +110,11 @@ ConnectionState Connection::getState() const { return state.load(); }
 void Connection::setState(ConnectionState connectionState) {
   ConnectionState const prev = state.load();
   if (prev != connectionState) {
-    state.store(connectionState);
+    {
+      std::lock_guard<std::mutex> const lock(state_mutex);
+      state.store(connectionState);
+    }
+    state_wait.notify_all();
     if (py_onStateChange.is_set()) {
       DEBUG_PRINT(Debug::Connection, "CALLBACK on_state_change");
       Module::ScopedGilAcquire const scoped("Connection.on_state_change");
@@ -197,6 +201,14 @@ bool Connection::isOpen() const {
 
 bool Connection::isMuted() const { return state == OPEN_MUTED; }
 
+bool Connection::waitOpen(const std::uint_fast32_t timeout_ms) {
+  Module::ScopedGilRelease const scoped("Connection.waitOpen");
+
+  std::unique_lock<std::mutex> lock(state_mutex);
+  return state_wait.wait_for(lock, timeout_ms * 1ms,
+                             [this] { return isOpen(); });
+}
+
 bool Connection::mute() {
   Module::ScopedGilRelease const scoped("Connection.mute");
 
@@ -318,7 +330,7 @@ bool Connection::awaitCommandSuccess(const std::string &cmdId) {
   auto const it = expectedResponseMap.find(cmdId);
   if (it != expectedResponseMap.end()) {
 
-    auto const end = std::chrono::system_clock::now() + commandTimeout_ms * 1ms;
+    auto const end = std::chrono::steady_clock::now() + commandTimeout_ms * 1ms;
 
     DEBUG_PRINT(Debug::Connection, "await_command_success] Await " + cmdId);
 
@@ -353,7 +365,7 @@ bool Connection::awaitCommandSuccess(const std::string &cmdId) {
                 "await_command_success] Stats " + cmdId + " | TOTAL " +
                     std::to_string(
                         std::chrono::duration_cast<std::chrono::microseconds>(
-                            end - std::chrono::system_clock::now())
+                            end - std::chrono::steady_clock::now())
                             .count()) +
                     u8" \xb5s");
   }
@@ -463,11 +475,10 @@ void Connection::onReceiveRaw(unsigned char *msg, unsigned char msgSize) {
   if (py_onReceiveRaw.is_set()) {
     DEBUG_PRINT(Debug::Connection, "CALLBACK on_receive_raw");
     Module::ScopedGilAcquire const scoped("Connection.on_receive_raw");
-    PyObject *pymemview =
-        PyMemoryView_FromMemory((char *)msg, msgSize, PyBUF_READ);
-    PyObject *pybytes = PyBytes_FromObject(pymemview);
+    // single copy of the message buffer, reference is owned by pybytes
+    py::bytes const pybytes(reinterpret_cast<const char *>(msg), msgSize);
 
-    py_onReceiveRaw.call(shared_from_this(), py::handle(pybytes));
+    py_onReceiveRaw.call(shared_from_this(), pybytes);
   }
 }
 
@@ -479,11 +490,10 @@ void Connection::onSendRaw(unsigned char *msg, unsigned char msgSize) {
   if (py_onSendRaw.is_set()) {
     DEBUG_PRINT(Debug::Connection, "CALLBACK on_send_raw");
     Module::ScopedGilAcquire const scoped("Connection.on_send_raw");
-    PyObject *pymemview =
-        PyMemoryView_FromMemory((char *)msg, msgSize, PyBUF_READ);
-    PyObject *pybytes = PyBytes_FromObject(pymemview);
+    // single copy of the message buffer, reference is owned by pybytes
+    py::bytes const pybytes(reinterpret_cast<const char *>(msg), msgSize);
 
-    py_onSendRaw.call(shared_from_this(), py::handle(pybytes));
+    py_onSendRaw.call(shared_from_this(), pybytes);
   }
 }
 
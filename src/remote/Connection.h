@@ -144,6 +144,14 @@ public:
    */
   bool isMuted() const;
 
+  /**
+   * @brief Block until connection to remote server is open or the timeout
+   * expires
+   * @param timeout_ms maximum time to wait in milliseconds
+   * @return information on open state
+   */
+  bool waitOpen(std::uint_fast32_t timeout_ms);
+
   /**
    * @brief Mute an open connection to remote server - disable messages from
    * server to client
@@ -383,6 +391,12 @@ private:
   /// @brief current state of state machine behaviour
   std::atomic<ConnectionState> state{CLOSED};
 
+  /// @brief MUTEX Lock to wait for state changes
+  std::mutex state_mutex{};
+
+  /// @brief Condition to wait for state changes
+  std::condition_variable state_wait{};
+
   /// @brief timestamp of last successfully connection opening
   std::atomic_uint_fast64_t connectedAt_ms{0};
 
@@ -43,6 +43,8 @@ bool Remote::isGlobalCommonAddress(const std::uint_fast16_t commonAddress) {
 
 std::string Remote::rawMessageFormatter(uint_fast8_t *msg, const int msgSize) {
   std::string s;
+  // fixed text fields plus three characters per object byte
+  s.reserve(128 + 3 * msgSize);
 
   /*
   for (int i = 0; i < msgSize; i++) {
@@ -128,11 +130,12 @@ std::string Remote::rawMessageFormatter(uint_fast8_t *msg, const int msgSize) {
         }
       }
       s += " (";
+      static constexpr char hex[] = "0123456789abcdef";
       int i;
       for (i = IEC60870_OBJECT_OFFSET; i < msgSize; i++) {
-        char buffer[6];
-        snprintf(buffer, 5, "%02x ", msg[i]);
-        s += buffer;
+        s += hex[(msg[i] >> 4) & 0x0F];
+        s += hex[msg[i] & 0x0F];
+        s += ' ';
       }
       s += ")";
     }
@@ -20,24 +20,41 @@
  See LICENSE file for the complete license text.
 """
 
+import concurrent.futures
 import functools
 
 import c104
+import queue
+import sys
+import threading
 import time
 from pathlib import Path
 
 USE_TLS = True
 ROOT = Path(__file__).absolute().parent
-
-c104.set_debug_mode(mode=c104.Debug.Client|c104.Debug.Connection)
+CERTS = ROOT / "certs"
+OWN_CERT = str(CERTS / "client1.crt")
+OWN_KEY = str(CERTS / "client1.key")
+CA_CERT = str(CERTS / "ca.crt")
+REMOTE_CERT = str(CERTS / "server.crt")
+
+# message debug mode also enables the raw message printer below
+c104.set_debug_mode(mode=c104.Debug.Client|c104.Debug.Connection|c104.Debug.Message)
 print("CL] DEBUG MODE: {0}".format(c104.get_debug_mode()))
 
+# debug mode does not change at runtime, test flags once instead of in every callback
+CL_DEBUG_CLIENT = c104.Debug.Client in c104.get_debug_mode()
+CL_DEBUG_MESSAGE = c104.Debug.Message in c104.get_debug_mode()
+
+# callbacks return this on every message, resolve the enum member once
+RESPONSE_SUCCESS = c104.ResponseState.SUCCESS
+
 if USE_TLS:
     tlsconf = c104.TransportSecurity(validate=True, only_known=True)
-    tlsconf.set_certificate(cert=str(ROOT / "certs/client1.crt"), key=str(ROOT / "certs/client1.key"))
-    tlsconf.set_ca_certificate(cert=str(ROOT / "certs/ca.crt"))
+    tlsconf.set_certificate(cert=OWN_CERT, key=OWN_KEY)
+    tlsconf.set_ca_certificate(cert=CA_CERT)
     tlsconf.set_version(min=c104.TlsVersion.TLS_1_2, max=c104.TlsVersion.TLS_1_2)
-    tlsconf.add_allowed_remote_certificate(cert=str(ROOT / "certs/server.crt"))
+    tlsconf.add_allowed_remote_certificate(cert=REMOTE_CERT)
     my_client = c104.Client(tick_rate_ms=1000, command_timeout_ms=5000, transport_security=tlsconf)
 else:
     my_client = c104.Client(tick_rate_ms=1000, command_timeout_ms=5000)
@@ -51,8 +68,15 @@ cl_connection_1 = my_client.add_connection(ip="127.0.0.1", port=19998, init=c104
 # CONNECTION STATE HANDLER
 ##################################
 
+cl_connected = threading.Event()
+
+
 def cl_ct_on_state_change(connection: c104.Connection, state: c104.ConnectionState) -> None:
     print("CL] Connection State Changed {0} | State {1}".format(connection.originator_address, state))
+    if state == c104.ConnectionState.OPEN:
+        cl_connected.set()
+    else:
+        cl_connected.clear()
 
 
 cl_connection_1.on_state_change(callable=cl_ct_on_state_change)
@@ -63,10 +87,11 @@ cl_connection_1.on_state_change(callable=cl_ct_on_state_change)
 ##################################
 
 def cl_pt_on_receive_point(point: c104.Point, previous_state: dict, message: c104.IncomingMessage) -> c104.ResponseState:
-    print("CL] {0} REPORT on IOA: {1} , new: {2}, prev: {3}, cot: {4}, quality: {5}".format(point.type, point.io_address, point.value, previous_state, message.cot, point.quality))
+    if CL_DEBUG_CLIENT:
+        print(f"CL] {point.type} REPORT on IOA: {point.io_address} , new: {point.value}, prev: {previous_state}, cot: {message.cot}, quality: {point.quality}")
     # print("{0}".format(message.is_negative))
     # print("-->| POINT: 0x{0} | EXPLAIN: {1}".format(message.raw.hex(), c104.explain_bytes(apdu=message.raw)))
-    return c104.ResponseState.SUCCESS
+    return RESPONSE_SUCCESS
 
 
 ##################################
@@ -92,12 +117,31 @@ my_client.on_new_point(callable=cl_on_new_point)
 # RAW MESSAGE HANDLER
 ##################################
 
+# raw messages are explained and printed by a separate thread to return to c104 immediately
+cl_raw_queue = queue.SimpleQueue()
+
+
+def cl_raw_printer() -> None:
+    while True:
+        direction, originator_address, data = cl_raw_queue.get()
+        print(f"CL] {direction} {c104.explain_bytes(apdu=data)} [{data.hex()}] | CONN OA {originator_address}")
+
+
+threading.Thread(target=cl_raw_printer, name="CL raw printer", daemon=True).start()
+
+
 def cl_ct_on_receive_raw(connection: c104.Connection, data: bytes) -> None:
-    print("CL] -->| {1} [{0}] | CONN OA {2}".format(data.hex(), c104.explain_bytes_dict(apdu=data), connection.originator_address))
+    # explain raw messages only in message debug mode
+    if not CL_DEBUG_MESSAGE:
+        return
+    cl_raw_queue.put_nowait(("-->|", connection.originator_address, data))
 
 
 def cl_ct_on_send_raw(connection: c104.Connection, data: bytes) -> None:
-    print("CL] <--| {1} [{0}] | CONN OA {2}".format(data.hex(), c104.explain_bytes_dict(apdu=data), connection.originator_address))
+    # explain raw messages only in message debug mode
+    if not CL_DEBUG_MESSAGE:
+        return
+    cl_raw_queue.put_nowait(("<--|", connection.originator_address, data))
 
 
 cl_connection_1.on_receive_raw(callable=cl_ct_on_receive_raw)
@@ -113,27 +157,29 @@ cl_step_command = cl_station_1.add_point(io_address=32, type=c104.Type.C_RC_TA_1
 cl_step_command.value = c104.Step.HIGHER
 
 
+CL_DUMP_HEADER = "             |   TYPE         |    IOA     |        VALUE         |      UPDATED AT      |      REPORTED AT     |      QUALITY      "
+CL_DUMP_SEPARATOR = "             |----------------|------------|----------------------|----------------------|----------------------|-------------------"
+CL_DUMP_ROW = "             | {0} | {1:10} | {2:20} | {3:20} | {4:20} | {5}\n" + CL_DUMP_SEPARATOR
+
+
 def cl_dump():
     global my_client, cl_connection_1
     if cl_connection_1.is_connected:
-        print("")
-        cl_ct_count = len(my_client.connections)
-        print("CL] |--+ CLIENT has {0} connections".format(cl_ct_count))
-        for ct_iter in range(cl_ct_count):
-            ct = my_client.connections[ct_iter]
-            ct_st_count = len(ct.stations)
-            print("       |--+ CONNECTION has {0} stations".format(ct_st_count))
-            for st_iter in range(ct_st_count):
-                st = ct.stations[st_iter]
-                st_pt_count = len(st.points)
-                print("          |--+ STATION {0} has {1} points".format(st.common_address, st_pt_count))
-                print("             |   TYPE         |    IOA     |        VALUE         |      UPDATED AT      |      REPORTED AT     |      QUALITY      ")
-                print("             |----------------|------------|----------------------|----------------------|----------------------|-------------------")
-                for pt_iter in range(st_pt_count):
-                    pt = st.points[pt_iter]
-                    print("             | {0} | {1:10} | {2:20} | {3:20} | {4:20} | {5}".format(pt.type, pt.io_address, pt.value, pt.updated_at_ms,
-                                                                                                pt.reported_at_ms, pt.quality))
-                    print("             |----------------|------------|----------------------|----------------------|----------------------|-------------------")
+        # collect the whole dump and write it at once
+        lines = [""]
+        cl_connections = my_client.connections
+        lines.append("CL] |--+ CLIENT has {0} connections".format(len(cl_connections)))
+        for ct in cl_connections:
+            ct_stations = ct.stations
+            lines.append("       |--+ CONNECTION has {0} stations".format(len(ct_stations)))
+            for st in ct_stations:
+                st_points = st.points_snapshot()
+                lines.append("          |--+ STATION {0} has {1} points".format(st.common_address, len(st_points)))
+                lines.append(CL_DUMP_HEADER)
+                lines.append(CL_DUMP_SEPARATOR)
+                lines.extend(CL_DUMP_ROW.format(*row) for row in st_points)
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
 
 
 ##################################
@@ -143,9 +189,8 @@ def cl_dump():
 input("Press Enter to start client...")
 my_client.start()
 
-while not cl_connection_1.is_connected:
+while not cl_connected.wait(timeout=3):
     print("CL] Waiting for connection to {0}:{1}".format(cl_connection_1.ip, cl_connection_1.port))
-    time.sleep(3)
 
 # input("Press Enter to stop client...")
 # my_client.stop()
@@ -182,7 +227,7 @@ time.sleep(1)
 cl_double_command = cl_station_2.add_point(io_address=22, type=c104.Type.C_DC_TA_1)
 
 cl_double_command.value = c104.Double.ON
-if cl_double_command.transmit(cause=c104.Cot.ACTIVATION):
+if cl_double_command.transmit(c104.Cot.ACTIVATION):
     print("CL] transmit: Double command ON successful")
 else:
     print("CL] transmit: Double command ON failed")
@@ -190,7 +235,7 @@ else:
 time.sleep(1)
 
 cl_double_command.value = c104.Double.OFF
-if cl_double_command.transmit(cause=c104.Cot.ACTIVATION):
+if cl_double_command.transmit(c104.Cot.ACTIVATION):
     print("CL] transmit: Double command OFF successful")
 else:
     print("CL] transmit: Double command OFF failed")
@@ -205,7 +250,7 @@ cl_setpoint_1 = cl_station_2.add_point(io_address=12, type=c104.Type.C_SE_NC_1)
 cl_setpoint_2 = cl_station_2.add_point(io_address=13, type=c104.Type.C_SE_NC_1)
 
 cl_setpoint_1.value = 13.45
-if cl_setpoint_1.transmit(cause=c104.Cot.ACTIVATION):
+if cl_setpoint_1.transmit(c104.Cot.ACTIVATION):
     print("CL] transmit: Setpoint 1 command successful")
 else:
     print("CL] transmit: Setpoint 1 command failed")
@@ -213,7 +258,7 @@ else:
 time.sleep(1)
 
 cl_setpoint_2.value = 13.45
-if cl_setpoint_2.transmit(cause=c104.Cot.ACTIVATION):
+if cl_setpoint_2.transmit(c104.Cot.ACTIVATION):
     print("CL] transmit: Setpoint 2 command successful")
 else:
     print("CL] transmit: Setpoint 2 command failed")
@@ -224,26 +269,31 @@ time.sleep(1)
 # Loop through points
 ##################################
 
-while cl_connection_1.is_connected:
-    cl_dump()
-
-    if cl_step_point.read():
-        print("CL]  > read: command successful")
-    else:
-        print("CL]  > read: command failed")
+# read and transmit block until the server responds, issue both in parallel
+with concurrent.futures.ThreadPoolExecutor(max_workers=2, thread_name_prefix="CL") as cl_executor:
+    while cl_connection_1.is_connected:
+        cl_dump()
 
-    time.sleep(3)
+        cl_read = cl_executor.submit(cl_step_point.read)
+        cl_transmit = None
+        if cl_step_command:
+            cl_transmit = cl_executor.submit(cl_step_command.transmit, cause=c104.Cot.ACTIVATION)
 
-    if cl_step_command:
-        if cl_step_command.transmit(cause=c104.Cot.ACTIVATION):
-            print("CL]  > transmit: Step command successful")
+        if cl_read.result():
+            print("CL]  > read: command successful")
         else:
-            print("CL]  > transmit: Step command failed")
-            # fix station
-            step_command_t = cl_station_2.add_point(io_address=32, type=c104.Type.C_RC_TA_1)
-            if step_command_t:
-                cl_step_command = step_command_t
-                cl_step_command.value = c104.Step.HIGHER
+            print("CL]  > read: command failed")
+
+        if cl_transmit:
+            if cl_transmit.result():
+                print("CL]  > transmit: Step command successful")
+            else:
+                print("CL]  > transmit: Step command failed")
+                # fix station
+                step_command_t = cl_station_2.add_point(io_address=32, type=c104.Type.C_RC_TA_1)
+                if step_command_t:
+                    cl_step_command = step_command_t
+                    cl_step_command.value = c104.Step.HIGHER
 
         time.sleep(3)
 
@@ -21,22 +21,48 @@
 """
 
 import c104
+import logging
 import time
 import datetime
 from pathlib import Path
 
 USE_TLS = True
 ROOT = Path(__file__).absolute().parent
+CERTS = ROOT / "certs"
+OWN_CERT = str(CERTS / "server.crt")
+OWN_KEY = str(CERTS / "server.key")
+CA_CERT = str(CERTS / "ca.crt")
+REMOTE_CERT = str(CERTS / "client1.crt")
 
 c104.set_debug_mode(mode=c104.Debug.Server)
 print("SV] DEBUG MODE: {0}".format(c104.get_debug_mode()))
 
+# raw messages are logged on DEBUG level, change level to logging.DEBUG to print them
+logging.basicConfig(format="%(message)s", level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# callbacks return these on every message, resolve the enum members once
+RESPONSE_SUCCESS = c104.ResponseState.SUCCESS
+RESPONSE_FAILURE = c104.ResponseState.FAILURE
+
+
+class ExplainBytes:
+    """ explain raw bytes lazily, only if the log record is really formatted
+    """
+    __slots__ = ("data",)
+
+    def __init__(self, data: bytes):
+        self.data = data
+
+    def __str__(self):
+        return "{1} [{0}]".format(self.data.hex(), c104.explain_bytes(apdu=self.data))
+
 if USE_TLS:
     tlsconf = c104.TransportSecurity(validate=True, only_known=True)
-    tlsconf.set_certificate(cert=str(ROOT / "certs/server.crt"), key=str(ROOT / "certs/server.key"))
-    tlsconf.set_ca_certificate(cert=str(ROOT / "certs/ca.crt"))
+    tlsconf.set_certificate(cert=OWN_CERT, key=OWN_KEY)
+    tlsconf.set_ca_certificate(cert=CA_CERT)
     tlsconf.set_version(min=c104.TlsVersion.TLS_1_2, max=c104.TlsVersion.TLS_1_2)
-    tlsconf.add_allowed_remote_certificate(cert=str(ROOT / "certs/client1.crt"))
+    tlsconf.add_allowed_remote_certificate(cert=REMOTE_CERT)
     my_server = c104.Server(ip="0.0.0.0", port=19998, tick_rate_ms=2000, max_connections=10, transport_security=tlsconf)
 else:
     my_server = c104.Server(ip="0.0.0.0", port=19998, tick_rate_ms=2000, max_connections=10)
@@ -56,16 +82,20 @@ def sv_on_connect(server: c104.Server, ip: str) -> bool:
 
 
 def sv_on_receive_raw(server: c104.Server, data: bytes) -> None:
-    print("SV] -->| {1} [{0}] | SERVER {2}:{3}".format(data.hex(), c104.explain_bytes_dict(apdu=data), server.ip, server.port))
+    # format only if raw messages are really logged
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("SV] -->| %s | SERVER %s:%s", ExplainBytes(data), server.ip, server.port)
 
 
 def sv_on_send_raw(server: c104.Server, data: bytes) -> None:
-    print("SV] <--| {1} [{0}] | SERVER {2}:{3}".format(data.hex(), c104.explain_bytes_dict(apdu=data), server.ip, server.port))
+    # format only if raw messages are really logged
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("SV] <--| %s | SERVER %s:%s", ExplainBytes(data), server.ip, server.port)
 
 
 def sv_on_clock_sync(server: c104.Server, ip: str, date_time: datetime.datetime) -> c104.ResponseState:
     print("SV] ->@| Time {0} from {1} | SERVER {2}:{3}".format(date_time, ip, server.ip, server.port))
-    return c104.ResponseState.SUCCESS
+    return RESPONSE_SUCCESS
 
 
 def sv_on_unexpected_message(server: c104.Server, message: c104.IncomingMessage, cause: c104.Umc) -> None:
@@ -83,32 +113,42 @@ my_server.on_unexpected_message(callable=sv_on_unexpected_message)
 # MEASUREMENT POINT WITH COMMAND
 ##################################
 
+# log prefixes of the server point callbacks, formatted once per IOA when a callback is registered
+SV_LOG_PREFIXES = {}
+
+
+def sv_set_log_prefix(point: c104.Point, action: str) -> None:
+    SV_LOG_PREFIXES[point.io_address] = "SV] {0} {1} on IOA: {2}".format(point.type, action, point.io_address)
+
+
 def sv_pt_on_setpoint_command(point: c104.Point, previous_state: dict, message: c104.IncomingMessage) -> c104.ResponseState:
-    print("SV] {0} SETPOINT COMMAND on IOA: {1}, new: {2}, prev: {3}, cot: {4}, quality: {5}".format(point.type, point.io_address, point.value, previous_state, message.cot, point.quality))
+    print(SV_LOG_PREFIXES[point.io_address] + ", new: {0}, prev: {1}, cot: {2}, quality: {3}".format(point.value, previous_state, message.cot, point.quality))
 
     if point.quality.is_good():
         if point.related_io_address:
             print("SV] -> RELATED IO ADDRESS: {}".format(point.related_io_address))
-            related_point = sv_station_2.get_point(point.related_io_address)
+            related_point = point.related_point
             if related_point:
                 print("SV] -> RELATED POINT VALUE UPDATE")
                 related_point.value = point.value
             else:
                 print("SV] -> RELATED POINT NOT FOUND!")
-        return c104.ResponseState.SUCCESS
+        return RESPONSE_SUCCESS
 
-    return c104.ResponseState.FAILURE
+    return RESPONSE_FAILURE
 
 
 sv_measurement_point = sv_station_2.add_point(io_address=11, type=c104.Type.M_ME_NC_1, report_ms=1000)
 sv_measurement_point.value = 12.34
 
 sv_measurement_setpoint = sv_station_2.add_point(io_address=12, type=c104.Type.C_SE_NC_1, report_ms=0, related_io_address=sv_measurement_point.io_address, related_io_autoreturn=True)
+sv_set_log_prefix(sv_measurement_setpoint, "SETPOINT COMMAND")
 sv_measurement_setpoint.on_receive(callable=sv_pt_on_setpoint_command)
 
 sv_measurement_setpoint_2 = sv_station_2.add_point(io_address=13, type=c104.Type.C_SE_NC_1)
 sv_measurement_setpoint_2.related_io_address = 14  # use invalid IOA for testing purpose
 sv_measurement_setpoint_2.related_io_autoreturn = False
+sv_set_log_prefix(sv_measurement_setpoint_2, "SETPOINT COMMAND")
 sv_measurement_setpoint_2.on_receive(callable=sv_pt_on_setpoint_command)
 
 
@@ -117,20 +157,20 @@ sv_measurement_setpoint_2.on_receive(callable=sv_pt_on_setpoint_command)
 ##################################
 
 def sv_pt_on_double_command(point: c104.Point, previous_state: dict, message: c104.IncomingMessage) -> c104.ResponseState:
-    print("SV] {0} DOUBLE COMMAND on IOA: {1}, new: {2}, prev: {3}, cot: {4}, quality: {5}".format(point.type, point.io_address, point.value, previous_state, message.cot, point.quality))
+    print(SV_LOG_PREFIXES[point.io_address] + ", new: {0}, prev: {1}, cot: {2}, quality: {3}".format(point.value, previous_state, message.cot, point.quality))
 
     if point.quality.is_good():
         if point.related_io_address:
             print("SV] -> RELATED IO ADDRESS: {}".format(point.related_io_address))
-            related_point = sv_station_2.get_point(point.related_io_address)
+            related_point = point.related_point
             if related_point:
                 print("SV] -> RELATED POINT VALUE UPDATE")
                 related_point.value = point.value
             else:
                 print("SV] -> RELATED POINT NOT FOUND!")
-        return c104.ResponseState.SUCCESS
+        return RESPONSE_SUCCESS
 
-    return c104.ResponseState.FAILURE
+    return RESPONSE_FAILURE
 
 
 sv_double_point = sv_station_2.add_point(io_address=21, type=c104.Type.M_DP_TB_1)
@@ -138,6 +178,7 @@ sv_double_point.value = c104.Double.OFF
 sv_double_point.report_ms = 4000
 
 sv_double_command = sv_station_2.add_point(io_address=22, type=c104.Type.C_DC_TA_1, report_ms=0, related_io_address=sv_double_point.io_address, related_io_autoreturn=True)
+sv_set_log_prefix(sv_double_command, "DOUBLE COMMAND")
 sv_double_command.on_receive(callable=sv_pt_on_double_command)
 
 ##################################
@@ -147,40 +188,49 @@ sv_double_command.on_receive(callable=sv_pt_on_double_command)
 sv_global_step_point_value = 0
 
 
+# point.value is a float, compare with plain numbers instead of enum members
+SV_STEP_LOWER = int(c104.Step.LOWER)
+SV_STEP_HIGHER = int(c104.Step.HIGHER)
+
+
 def sv_pt_on_step_command(point: c104.Point, previous_state: dict, message: c104.IncomingMessage) -> c104.ResponseState:
     global sv_global_step_point_value
-    print("SV] {0} STEP COMMAND on IOA: {1}, new: {2}, prev: {3}, cot: {4}, quality: {5}".format(point.type, point.io_address, point.value, previous_state, message.cot, point.quality))
+    print(SV_LOG_PREFIXES[point.io_address] + ", new: {0}, prev: {1}, cot: {2}, quality: {3}".format(point.value, previous_state, message.cot, point.quality))
 
-    if point.value == c104.Step.LOWER:
+    if point.value == SV_STEP_LOWER:
         sv_global_step_point_value -= 1
-        return c104.ResponseState.SUCCESS
+        return RESPONSE_SUCCESS
 
-    if point.value == c104.Step.HIGHER:
+    if point.value == SV_STEP_HIGHER:
         sv_global_step_point_value += 1
-        return c104.ResponseState.SUCCESS
+        return RESPONSE_SUCCESS
 
-    return c104.ResponseState.FAILURE
+    return RESPONSE_FAILURE
 
 
 def sv_pt_on_before_read_step_point(point: c104.Point) -> None:
     global sv_global_step_point_value
-    print("SV] {0} READ COMMAND on IOA: {1}".format(point.type, point.io_address))
+    print(SV_LOG_PREFIXES[point.io_address])
     point.value = sv_global_step_point_value
 
 
 def sv_pt_on_before_auto_transmit_step_point(point: c104.Point) -> None:
     global sv_global_step_point_value
-    print("SV] {0} AUTO TRANSMIT on IOA: {1}".format(point.type, point.io_address))
+    # called on every cyclic report, only log on DEBUG level
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("SV] %s AUTO TRANSMIT on IOA: %s", point.type, point.io_address)
     point.value = sv_global_step_point_value
 
 
 sv_step_point = sv_station_2.add_point(io_address=31, type=c104.Type.M_ST_TB_1)
 sv_step_point.value = sv_global_step_point_value
 sv_step_point.report_ms = 2000
+sv_set_log_prefix(sv_step_point, "READ COMMAND")
 sv_step_point.on_before_read(callable=sv_pt_on_before_read_step_point)
 sv_step_point.on_before_auto_transmit(callable=sv_pt_on_before_auto_transmit_step_point)
 
 sv_step_command = sv_station_2.add_point(io_address=32, type=c104.Type.C_RC_TA_1, report_ms=0, related_io_address=sv_step_point.io_address, related_io_autoreturn=True)
+sv_set_log_prefix(sv_step_command, "STEP COMMAND")
 sv_step_command.on_receive(callable=sv_pt_on_step_command)
 
 ##################################
@@ -192,22 +242,30 @@ my_server.start()
 
 
 class ServerPointMethodCallbackTestClass:
+    __slots__ = ("x", "called")
+
     def __init__(self, x: str):
         self.x = x
+        self.called = False
 
     def pt_on_before_auto_transmit_measurement_point(self, point: c104.Point) -> None:
-        print(self.x, "--> {0} AUTO TRANSMIT on IOA: {1}".format(point.type, point.io_address))
+        # print the first call to show that method callbacks work, log every further call on DEBUG level only
+        if not self.called:
+            self.called = True
+            print(self.x, "--> {0} AUTO TRANSMIT on IOA: {1}".format(point.type, point.io_address))
+        elif logger.isEnabledFor(logging.DEBUG):
+            logger.debug("%s --> %s AUTO TRANSMIT on IOA: %s", self.x, point.type, point.io_address)
 
 sv_pmct = ServerPointMethodCallbackTestClass("SV] CALLBACK METHOD")
 
 time.sleep(5)
 sv_measurement_point.value = 1234
-sv_measurement_point.transmit(cause=c104.Cot.SPONTANEOUS)
+sv_measurement_point.transmit(c104.Cot.SPONTANEOUS)
 sv_measurement_point.on_before_auto_transmit(callable=sv_pmct.pt_on_before_auto_transmit_measurement_point)
 
 time.sleep(5)
-sv_measurement_point.set(value=-1234.56, quality=c104.Quality.Invalid, timestamp_ms=int(time.time() * 1000))
-sv_measurement_point.transmit(cause=c104.Cot.SPONTANEOUS)
+sv_measurement_point.set(value=-1234.56, quality=c104.Quality.Invalid)
+sv_measurement_point.transmit(c104.Cot.SPONTANEOUS)
 
 ##################################
 # done
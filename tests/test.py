@@ -21,7 +21,8 @@
 """
 
 import c104
-import time
+import logging
+import sys
 import datetime
 
 print("-"*60)
@@ -31,21 +32,50 @@ print("-"*60)
 c104.set_debug_mode(mode=c104.Debug())
 print("DEBUG MODE: {0}".format(c104.get_debug_mode()))
 
+# raw messages are logged on DEBUG level, change level to logging.DEBUG to print them
+logging.basicConfig(format="%(message)s", level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# callbacks return these on every message, resolve the enum members once
+RESPONSE_SUCCESS = c104.ResponseState.SUCCESS
+RESPONSE_FAILURE = c104.ResponseState.FAILURE
+
+
+class ExplainBytes:
+    """ explain raw bytes lazily, only if the log record is really formatted
+    """
+    __slots__ = ("data",)
+
+    def __init__(self, data: bytes):
+        self.data = data
+
+    def __str__(self):
+        return "{1} [{0}]".format(self.data.hex(), c104.explain_bytes(apdu=self.data))
+
 ##################################
 # CLIENT
 ##################################
 
-my_client = c104.Client(tick_rate_ms=1000, command_timeout_ms=5000)
+# loopback only: commands are confirmed within milliseconds, the timeout keeps a margin above the client tick rate
+my_client = c104.Client(tick_rate_ms=1000, command_timeout_ms=3000)
 my_client.originator_address = 123
 
 cl_connection_1 = my_client.add_connection(ip="127.0.0.1", port=2404)
 
 
+# log prefixes of the client point callbacks, formatted once per IOA when a callback is registered
+CL_LOG_PREFIXES = {}
+
+
+def cl_set_log_prefix(point: c104.Point, action: str) -> None:
+    CL_LOG_PREFIXES[point.io_address] = "CL] {0} {1} on IOA: {2}".format(point.type, action, point.io_address)
+
+
 def cl_pt_on_receive_point(point: c104.Point, previous_state: dict, message: c104.IncomingMessage) -> c104.ResponseState:
-    print("CL] {0} REPORT on IOA: {1} , new: {2}, prev: {3}, cot: {4}, quality: {5}".format(point.type, point.io_address, point.value, previous_state, message.cot, point.quality))
+    print(CL_LOG_PREFIXES[point.io_address] + " , new: {0}, prev: {1}, cot: {2}, quality: {3}".format(point.value, previous_state, message.cot, point.quality))
     # print("{0}".format(message.is_negative))
     # print("-->| POINT: 0x{0} | EXPLAIN: {1}".format(message.raw.hex(), c104.explain_bytes(apdu=message.raw)))
-    return c104.ResponseState.SUCCESS
+    return RESPONSE_SUCCESS
 
 
 ##################################
@@ -60,6 +90,7 @@ def cl_on_new_station(client: c104.Client, connection: c104.Connection, common_a
 def cl_on_new_point(client: c104.Client, station: c104.Station, io_address: int, point_type: c104.Type) -> None:
     print("CL] NEW POINT: {1} with IOA {0} | CLIENT OA {2}".format(io_address, point_type, client.originator_address))
     point = station.add_point(io_address=io_address, type=point_type)
+    cl_set_log_prefix(point, "REPORT")
     point.on_receive(callable=cl_pt_on_receive_point)
 
 
@@ -72,11 +103,15 @@ my_client.on_new_point(callable=cl_on_new_point)
 ##################################
 
 def cl_ct_on_receive_raw(connection: c104.Connection, data: bytes) -> None:
-    print("CL] -->| {1} [{0}] | CONN OA {2}".format(data.hex(), c104.explain_bytes_dict(apdu=data), connection.originator_address))
+    # format only if raw messages are really logged
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("CL] -->| %s | CONN OA %s", ExplainBytes(data), connection.originator_address)
 
 
 def cl_ct_on_send_raw(connection: c104.Connection, data: bytes) -> None:
-    print("CL] <--| {1} [{0}] | CONN OA {2}".format(data.hex(), c104.explain_bytes_dict(apdu=data), connection.originator_address))
+    # format only if raw messages are really logged
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("CL] <--| %s | CONN OA %s", ExplainBytes(data), connection.originator_address)
 
 
 cl_connection_1.on_receive_raw(callable=cl_ct_on_receive_raw)
@@ -92,34 +127,53 @@ cl_step_command = cl_station_1.add_point(io_address=32, type=c104.Type.C_RC_TA_1
 cl_step_command.value = c104.Step.HIGHER
 
 
+CL_DUMP_HEADER = "             |   TYPE         |    IOA     |        VALUE         |      UPDATED AT      |      REPORTED AT     |      QUALITY      "
+CL_DUMP_SEPARATOR = "             |----------------|------------|----------------------|----------------------|----------------------|-------------------"
+CL_DUMP_ROW = "             | {0} | {1:10} | {2:20} | {3:20} | {4:20} | {5}\n" + CL_DUMP_SEPARATOR
+
+
 def cl_dump():
     global my_client,cl_connection_1
     if cl_connection_1.is_connected:
-        print("")
-        cl_ct_count = len(my_client.connections)
-        print("CL] |--+ CLIENT has {0} connections".format(cl_ct_count))
-        for ct_iter in range(cl_ct_count):
-            ct = my_client.connections[ct_iter]
-            ct_st_count = len(ct.stations)
-            print("       |--+ CONNECTION has {0} stations".format(ct_st_count))
-            for st_iter in range(ct_st_count):
-                st = ct.stations[st_iter]
-                st_pt_count = len(st.points)
-                print("          |--+ STATION {0} has {1} points".format(st.common_address, st_pt_count))
-                print("             |   TYPE         |    IOA     |        VALUE         |      UPDATED AT      |      REPORTED AT     |      QUALITY      ")
-                print("             |----------------|------------|----------------------|----------------------|----------------------|-------------------")
-                for pt_iter in range(st_pt_count):
-                    pt = st.points[pt_iter]
-                    print("             | {0} | {1:10} | {2:20} | {3:20} | {4:20} | {5}".format(pt.type, pt.io_address, pt.value, pt.updated_at_ms,
-                                                                                                pt.reported_at_ms, pt.quality))
-                    print("             |----------------|------------|----------------------|----------------------|----------------------|-------------------")
+        # collect the whole dump and write it at once
+        lines = [""]
+        cl_connections = my_client.connections
+        lines.append("CL] |--+ CLIENT has {0} connections".format(len(cl_connections)))
+        for ct in cl_connections:
+            ct_stations = ct.stations
+            lines.append("       |--+ CONNECTION has {0} stations".format(len(ct_stations)))
+            for st in ct_stations:
+                st_points = st.points_snapshot()
+                lines.append("          |--+ STATION {0} has {1} points".format(st.common_address, len(st_points)))
+                lines.append(CL_DUMP_HEADER)
+                lines.append(CL_DUMP_SEPARATOR)
+                lines.extend(CL_DUMP_ROW.format(*row) for row in st_points)
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+
+
+def cl_wait_for_report(point: c104.Point = None, received_count: int = -1, timeout_ms: int = 3000) -> None:
+    """ wait for the next report of the point affected by the last command instead of sleeping a fixed time,
+    pass the received_count read before sending the command to not miss an early report,
+    defaults to the periodic measurement point
+    """
+    if point is None:
+        if not cl_connection_1.wait_open(timeout_ms=timeout_ms):
+            raise RuntimeError("CL] Connection to {0}:{1} not open within {2} ms".format(cl_connection_1.ip, cl_connection_1.port, timeout_ms))
+        station = cl_connection_1.get_station(common_address=47)
+        point = station.get_point(io_address=11) if station else None
+        if point is None:
+            raise RuntimeError("CL] Measurement point IOA 11 of station 47 not found")
+    if not point.wait_for_update(timeout_ms=timeout_ms, received_count=received_count):
+        print("CL] No report on IOA {0} within {1} ms".format(point.io_address, timeout_ms))
 
 
 ##################################
 # SERVER
 ##################################
 
-my_server = c104.Server(ip="0.0.0.0", port=2404, tick_rate_ms=2000, max_connections=10)
+# tick as often as the fastest cyclic report (report_ms=1000) of the measurement point
+my_server = c104.Server(ip="0.0.0.0", port=2404, tick_rate_ms=1000, max_connections=10)
 my_server.max_connections = 11
 
 sv_station_2 = my_server.add_station(common_address=47)
@@ -135,16 +189,20 @@ def sv_on_connect(server: c104.Server, ip: str) -> bool:
 
 
 def sv_on_receive_raw(server: c104.Server, data: bytes) -> None:
-    print("SV] -->| {1} [{0}] | SERVER {2}:{3}".format(data.hex(), c104.explain_bytes(apdu=data), server.ip, server.port))
+    # format only if raw messages are really logged
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("SV] -->| %s | SERVER %s:%s", ExplainBytes(data), server.ip, server.port)
 
 
 def sv_on_send_raw(server: c104.Server, data: bytes) -> None:
-    print("SV] <--| {1} [{0}] | SERVER {2}:{3}".format(data.hex(), c104.explain_bytes(apdu=data), server.ip, server.port))
+    # format only if raw messages are really logged
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("SV] <--| %s | SERVER %s:%s", ExplainBytes(data), server.ip, server.port)
 
 
 def sv_on_clock_sync(server: c104.Server, ip: str, date_time: datetime.datetime) -> c104.ResponseState:
     print("SV] ->@| Time {0} from {1} | SERVER {2}:{3}".format(date_time, ip, server.ip, server.port))
-    return c104.ResponseState.SUCCESS
+    return RESPONSE_SUCCESS
 
 
 def sv_on_unexpected_message(server: c104.Server, message: c104.IncomingMessage, cause: c104.Umc) -> None:
@@ -162,21 +220,29 @@ my_server.on_unexpected_message(callable=sv_on_unexpected_message)
 # SERVER: MEASUREMENT POINT WITH COMMAND
 ##################################
 
+# log prefixes of the server point callbacks, formatted once per IOA when a callback is registered
+SV_LOG_PREFIXES = {}
+
+
+def sv_set_log_prefix(point: c104.Point, action: str) -> None:
+    SV_LOG_PREFIXES[point.io_address] = "SV] {0} {1} on IOA: {2}".format(point.type, action, point.io_address)
+
+
 def sv_pt_on_setpoint_command(point: c104.Point, previous_state: dict, message: c104.IncomingMessage) -> c104.ResponseState:
-    print("SV] {0} SETPOINT COMMAND on IOA: {1}, new: {2}, prev: {3}, cot: {4}, quality: {5}".format(point.type, point.io_address, point.value, previous_state, message.cot, point.quality))
+    print(SV_LOG_PREFIXES[point.io_address] + ", new: {0}, prev: {1}, cot: {2}, quality: {3}".format(point.value, previous_state, message.cot, point.quality))
 
     if point.quality.is_good():
         if point.related_io_address:
             print("SV] -> RELATED IO ADDRESS: {}".format(point.related_io_address))
-            related_point = sv_station_2.get_point(point.related_io_address)
+            related_point = point.related_point
             if related_point:
                 print("SV] -> RELATED POINT VALUE UPDATE")
                 related_point.value = point.value
             else:
                 print("SV] -> RELATED POINT NOT FOUND!")
-        return c104.ResponseState.SUCCESS
+        return RESPONSE_SUCCESS
 
-    return c104.ResponseState.FAILURE
+    return RESPONSE_FAILURE
 
 
 # Nan in short measurement value
@@ -187,11 +253,13 @@ sv_measurement_point = sv_station_2.add_point(io_address=11, type=c104.Type.M_ME
 sv_measurement_point.value = 12.34
 
 sv_measurement_setpoint = sv_station_2.add_point(io_address=12, type=c104.Type.C_SE_NC_1, report_ms=0, related_io_address=sv_measurement_point.io_address, related_io_autoreturn=True)
+sv_set_log_prefix(sv_measurement_setpoint, "SETPOINT COMMAND")
 sv_measurement_setpoint.on_receive(callable=sv_pt_on_setpoint_command)
 
 sv_measurement_setpoint_2 = sv_station_2.add_point(io_address=13, type=c104.Type.C_SE_NC_1)
 sv_measurement_setpoint_2.related_io_address = 13  # use invalid IOA for testing purpose
 sv_measurement_setpoint_2.related_io_autoreturn = False
+sv_set_log_prefix(sv_measurement_setpoint_2, "SETPOINT COMMAND")
 sv_measurement_setpoint_2.on_receive(callable=sv_pt_on_setpoint_command)
 
 
@@ -200,20 +268,20 @@ sv_measurement_setpoint_2.on_receive(callable=sv_pt_on_setpoint_command)
 ##################################
 
 def sv_pt_on_double_command(point: c104.Point, previous_state: dict, message: c104.IncomingMessage) -> c104.ResponseState:
-    print("SV] {0} DOUBLE COMMAND on IOA: {1}, new: {2}, prev: {3}, cot: {4}, quality: {5}".format(point.type, point.io_address, point.value, previous_state, message.cot, point.quality))
+    print(SV_LOG_PREFIXES[point.io_address] + ", new: {0}, prev: {1}, cot: {2}, quality: {3}".format(point.value, previous_state, message.cot, point.quality))
 
     if point.quality.is_good():
         if point.related_io_address:
             print("SV] -> RELATED IO ADDRESS: {}".format(point.related_io_address))
-            related_point = sv_station_2.get_point(point.related_io_address)
+            related_point = point.related_point
             if related_point:
                 print("SV] -> RELATED POINT VALUE UPDATE")
                 related_point.value = point.value
             else:
                 print("SV] -> RELATED POINT NOT FOUND!")
-        return c104.ResponseState.SUCCESS
+        return RESPONSE_SUCCESS
 
-    return c104.ResponseState.FAILURE
+    return RESPONSE_FAILURE
 
 
 sv_double_point = sv_station_2.add_point(io_address=21, type=c104.Type.M_DP_TB_1)
@@ -221,6 +289,7 @@ sv_double_point.value = c104.Double.OFF
 sv_double_point.report_ms = 4000
 
 sv_double_command = sv_station_2.add_point(io_address=22, type=c104.Type.C_DC_TA_1, report_ms=0, related_io_address=sv_double_point.io_address, related_io_autoreturn=True)
+sv_set_log_prefix(sv_double_command, "DOUBLE COMMAND")
 sv_double_command.on_receive(callable=sv_pt_on_double_command)
 
 ##################################
@@ -230,40 +299,49 @@ sv_double_command.on_receive(callable=sv_pt_on_double_command)
 sv_global_step_point_value = 0
 
 
+# point.value is a float, compare with plain numbers instead of enum members
+SV_STEP_LOWER = int(c104.Step.LOWER)
+SV_STEP_HIGHER = int(c104.Step.HIGHER)
+
+
 def sv_pt_on_step_command(point: c104.Point, previous_state: dict, message: c104.IncomingMessage) -> c104.ResponseState:
     global sv_global_step_point_value
-    print("SV] {0} STEP COMMAND on IOA: {1}, new: {2}, prev: {3}, cot: {4}, quality: {5}".format(point.type, point.io_address, point.value, previous_state, message.cot, point.quality))
+    print(SV_LOG_PREFIXES[point.io_address] + ", new: {0}, prev: {1}, cot: {2}, quality: {3}".format(point.value, previous_state, message.cot, point.quality))
 
-    if point.value == c104.Step.LOWER:
+    if point.value == SV_STEP_LOWER:
         sv_global_step_point_value -= 1
-        return c104.ResponseState.SUCCESS
+        return RESPONSE_SUCCESS
 
-    if point.value == c104.Step.HIGHER:
+    if point.value == SV_STEP_HIGHER:
         sv_global_step_point_value += 1
-        return c104.ResponseState.SUCCESS
+        return RESPONSE_SUCCESS
 
-    return c104.ResponseState.FAILURE
+    return RESPONSE_FAILURE
 
 
 def sv_pt_on_before_read_step_point(point: c104.Point) -> None:
     global sv_global_step_point_value
-    print("SV] {0} READ COMMAND on IOA: {1}".format(point.type, point.io_address))
+    print(SV_LOG_PREFIXES[point.io_address])
     point.value = sv_global_step_point_value
 
 
 def sv_pt_on_before_auto_transmit_step_point(point: c104.Point) -> None:
     global sv_global_step_point_value
-    print("SV] {0} AUTO TRANSMIT on IOA: {1}".format(point.type, point.io_address))
+    # called on every cyclic report, only log on DEBUG level
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("SV] %s AUTO TRANSMIT on IOA: %s", point.type, point.io_address)
     point.value = sv_global_step_point_value
 
 
 sv_step_point = sv_station_2.add_point(io_address=31, type=c104.Type.M_ST_TB_1)
 sv_step_point.value = sv_global_step_point_value
 sv_step_point.report_ms = 2000
+sv_set_log_prefix(sv_step_point, "READ COMMAND")
 sv_step_point.on_before_read(callable=sv_pt_on_before_read_step_point)
 sv_step_point.on_before_auto_transmit(callable=sv_pt_on_before_auto_transmit_step_point)
 
 sv_step_command = sv_station_2.add_point(io_address=32, type=c104.Type.C_RC_TA_1, report_ms=0, related_io_address=sv_step_point.io_address, related_io_autoreturn=True)
+sv_set_log_prefix(sv_step_command, "STEP COMMAND")
 sv_step_command.on_receive(callable=sv_pt_on_step_command)
 
 
@@ -276,13 +354,12 @@ sv_step_command.on_receive(callable=sv_pt_on_step_command)
 my_client.start()
 my_server.start()
 
-while not cl_connection_1.is_connected:
-    print("CL] Try to connect to {0}:{1}".format(cl_connection_1.ip, cl_connection_1.port))
+while not cl_connection_1.wait_open(timeout_ms=3000):
+    print("CL] Try to connect to {0}:{1} | SV] open {2}, active {3}".format(cl_connection_1.ip, cl_connection_1.port, my_server.open_connection_count, my_server.active_connection_count))
     cl_connection_1.connect()
-    time.sleep(3)
 
+cl_wait_for_report()
 cl_dump()
-time.sleep(3)
 print("-"*60)
 
 ##################################
@@ -290,34 +367,39 @@ print("-"*60)
 ##################################
 
 class PointMethodCallbackTestClass:
+    __slots__ = ("x", "called")
+
     def __init__(self, x: str):
         self.x = x
+        self.called = False
 
     def pt_on_before_auto_transmit_measurement_point(self, point: c104.Point) -> None:
-        print(self.x, "--> {0} AUTO TRANSMIT on IOA: {1}".format(point.type, point.io_address))
+        # print the first call to show that method callbacks work, log every further call on DEBUG level only
+        if not self.called:
+            self.called = True
+            print(self.x, "--> {0} AUTO TRANSMIT on IOA: {1}".format(point.type, point.io_address))
+        elif logger.isEnabledFor(logging.DEBUG):
+            logger.debug("%s --> %s AUTO TRANSMIT on IOA: %s", self.x, point.type, point.io_address)
 
 pmct = PointMethodCallbackTestClass("SV] CALLBACK METHOD")
 
-time.sleep(3)
+cl_wait_for_report()
 cl_dump()
-time.sleep(3)
 print("-"*60)
 
 sv_measurement_point.value = 1234
-sv_measurement_point.transmit(cause=c104.Cot.SPONTANEOUS)
+sv_measurement_point.transmit(c104.Cot.SPONTANEOUS)
 sv_measurement_point.on_before_auto_transmit(callable=pmct.pt_on_before_auto_transmit_measurement_point)
 
-time.sleep(3)
+cl_wait_for_report()
 cl_dump()
-time.sleep(3)
 print("-"*60)
 
-sv_measurement_point.set(value=-1234.56, quality=c104.Quality.Invalid, timestamp_ms=int(time.time() * 1000))
-sv_measurement_point.transmit(cause=c104.Cot.SPONTANEOUS)
+sv_measurement_point.set(value=-1234.56, quality=c104.Quality.Invalid)
+sv_measurement_point.transmit(c104.Cot.SPONTANEOUS)
 
-time.sleep(3)
+cl_wait_for_report()
 cl_dump()
-time.sleep(3)
 print("-"*60)
 
 cl_station_2 = cl_connection_1.add_station(common_address=47)
@@ -332,14 +414,14 @@ if cl_step_point is None:
 
 cl_nan_command = cl_station_2.add_point(io_address=87, type=c104.Type.C_SE_NC_1)
 cl_nan_command.value = float("NaN")
-if cl_nan_command.transmit(cause=c104.Cot.ACTIVATION):
+if cl_nan_command.transmit(c104.Cot.ACTIVATION):
     print("CL] transmit: Nan in short command successful")
 else:
     print("CL] transmit: Nan in short command failed/invalid")
 
-time.sleep(3)
+# the NaN command has no related monitoring point, dump after the next periodic report instead
+cl_wait_for_report()
 cl_dump()
-time.sleep(3)
 print("-"*60)
 
 if sv_step_point.read():
@@ -347,12 +429,14 @@ if sv_step_point.read():
 else:
     print("CL] read: command failed")
 
-time.sleep(3)
 print("-"*60)
 
+cl_set_log_prefix(cl_step_point, "REPORT")
 cl_step_point.on_receive(callable=cl_pt_on_receive_point)
 
-if cl_step_command.transmit(cause=c104.Cot.ACTIVATION):
+# the step command auto returns its related step point
+cl_step_point_count = cl_step_point.received_count
+if cl_step_command.transmit(c104.Cot.ACTIVATION):
     print("CL] transmit: Step command successful")
 else:
     print("CL] transmit: Step command failed/invalid")
@@ -363,67 +447,69 @@ else:
             cl_step_command = cl_step_command_t
             cl_step_command.value = c104.Step.HIGHER
 
-        if cl_step_command.transmit(cause=c104.Cot.ACTIVATION):
+        if cl_step_command.transmit(c104.Cot.ACTIVATION):
             print("CL] transmit: Step command successful/fixed")
 
-time.sleep(3)
+cl_wait_for_report(point=cl_step_point, received_count=cl_step_point_count)
 cl_dump()
-time.sleep(3)
 print("-"*60)
 
 cl_measurement_point = cl_station_2.get_point(io_address=11)
 if cl_measurement_point:
+    cl_set_log_prefix(cl_measurement_point, "REPORT")
     cl_measurement_point.on_receive(callable=cl_pt_on_receive_point)
 
 ##################################
 # double command
 ##################################
 
+# the double command auto returns its related double point
+cl_double_point = cl_station_2.get_point(io_address=21)
+cl_double_point_count = cl_double_point.received_count if cl_double_point else -1
+
 cl_double_command = cl_station_2.add_point(io_address=22, type=c104.Type.C_DC_TA_1)
 cl_double_command.value = c104.Double.ON
-if cl_double_command.transmit(cause=c104.Cot.ACTIVATION):
+if cl_double_command.transmit(c104.Cot.ACTIVATION):
     print("CL] transmit: Double command ON successful")
 else:
     print("CL] transmit: Double command ON failed")
 
-time.sleep(3)
 
 cl_double_command.value = c104.Double.OFF
-if cl_double_command.transmit(cause=c104.Cot.ACTIVATION):
+if cl_double_command.transmit(c104.Cot.ACTIVATION):
     print("CL] transmit: Double command OFF successful")
 else:
     print("CL] transmit: Double command OFF failed")
 
-time.sleep(3)
+cl_wait_for_report(point=cl_double_point, received_count=cl_double_point_count)
 cl_dump()
-time.sleep(3)
 print("-"*60)
 
 ##################################
 # setpoint command
 ##################################
 
-cl_setpoint_1 = cl_station_2.add_point(io_address=12, type=c104.Type.C_SE_NC_1)
-cl_setpoint_2 = cl_station_2.add_point(io_address=13, type=c104.Type.C_SE_NC_1)
+cl_setpoint_1, cl_setpoint_2 = cl_station_2.add_points(points=[
+    {"io_address": 12, "type": c104.Type.C_SE_NC_1},
+    {"io_address": 13, "type": c104.Type.C_SE_NC_1},
+])
 
-cl_setpoint_1.value = 54.32
-if cl_setpoint_1.transmit(cause=c104.Cot.ACTIVATION):
-    print("CL] transmit: Setpoint command successful")
-else:
-    print("CL] transmit: Setpoint command failed")
-
-time.sleep(3)
-print("-"*60)
+# the first setpoint auto returns its related measurement point, the second one refers to an invalid IOA
+cl_measurement_point_count = cl_measurement_point.received_count if cl_measurement_point else -1
 
+cl_setpoint_1.value = 54.32
 cl_setpoint_2.value = 11.11
-if cl_setpoint_2.transmit(cause=c104.Cot.ACTIVATION):
-    print("CL] transmit: Setpoint command successful")
-else:
-    print("CL] transmit: Setpoint command failed")
-
-time.sleep(3)
+for setpoint_result in cl_station_2.transmit_many(points=[
+    (cl_setpoint_1, c104.Cot.ACTIVATION),
+    (cl_setpoint_2, c104.Cot.ACTIVATION),
+]):
+    if setpoint_result:
+        print("CL] transmit: Setpoint command successful")
+    else:
+        print("CL] transmit: Setpoint command failed")
+
+cl_wait_for_report(point=cl_measurement_point, received_count=cl_measurement_point_count)
 cl_dump()
-time.sleep(3)
 print("-"*60)
 
 ##################################
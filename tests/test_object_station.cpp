@@ -32,3 +32,22 @@ TEST_CASE("Create station", "[object::station]") {
   auto station = Object::Station::create(14, nullptr, nullptr);
   REQUIRE(station->getCommonAddress() == 14);
 }
+
+TEST_CASE("Add points to station", "[object::station]") {
+  auto station = Object::Station::create(14, nullptr, nullptr);
+  auto points = station->addPoints({{11, IEC60870_5_TypeID::M_SP_NA_1},
+                                    {12, IEC60870_5_TypeID::M_DP_NA_1},
+                                    {11, IEC60870_5_TypeID::M_ME_NC_1}});
+  REQUIRE(points.size() == 3);
+  REQUIRE(points[0]->getInformationObjectAddress() == 11);
+  REQUIRE(points[1]->getType() == IEC60870_5_TypeID::M_DP_NA_1);
+  // duplicate information object address
+  REQUIRE(points[2].get() == nullptr);
+  REQUIRE(station->getPoints().size() == 2);
+  REQUIRE(station->getPoint(12) == points[1]);
+
+  // invalid definitions leave the station unchanged
+  REQUIRE_THROWS(station->addPoints({{13, IEC60870_5_TypeID::M_SP_NA_1},
+                                     {0, IEC60870_5_TypeID::M_SP_NA_1}}));
+  REQUIRE(station->getPoints().size() == 2);
+}